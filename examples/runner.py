@@ -14,55 +14,27 @@ Usage:
 
 from __future__ import annotations
 
+import importlib
+import logging
 import sys
+from functools import cache
+from typing import Callable
 
-# --- OOP Concept Imports ---
-from src.oops_concepts.classes_and_objects import demo as classes_demo
-from src.oops_concepts.encapsulation import demo as encapsulation_demo
-from src.oops_concepts.inheritance import demo as inheritance_demo
-from src.oops_concepts.polymorphism import demo as polymorphism_demo
-from src.oops_concepts.abstraction import demo as abstraction_demo
-from src.oops_concepts.composition import demo as composition_demo
-from src.oops_concepts.solid_principles import demo as solid_demo
-
-# --- Design Pattern Imports ---
-from src.design_patterns.creational.singleton import demo as singleton_demo
-from src.design_patterns.creational.factory import demo as factory_demo
-from src.design_patterns.creational.builder import demo as builder_demo
-from src.design_patterns.creational.prototype import demo as prototype_demo
-from src.design_patterns.creational.abstract_factory import demo as abstract_factory_demo
-
-from src.design_patterns.structural.adapter import demo as adapter_demo
-from src.design_patterns.structural.decorator import demo as decorator_demo
-from src.design_patterns.structural.facade import demo as facade_demo
-from src.design_patterns.structural.proxy import demo as proxy_demo
-from src.design_patterns.structural.composite import demo as composite_demo
-from src.design_patterns.structural.bridge import demo as bridge_demo
-
-from src.design_patterns.behavioral.strategy import demo as strategy_demo
-from src.design_patterns.behavioral.observer import demo as observer_demo
-from src.design_patterns.behavioral.chain_of_responsibility import demo as chain_demo
-from src.design_patterns.behavioral.command import demo as command_demo
-from src.design_patterns.behavioral.state import demo as state_demo
-from src.design_patterns.behavioral.template_method import demo as template_method_demo
-from src.design_patterns.behavioral.iterator import demo as iterator_demo
-from src.design_patterns.behavioral.mediator import demo as mediator_demo
-
-from src.design_patterns.architectural.mvc import demo as mvc_demo
-from src.design_patterns.architectural.dependency_injection import demo as di_demo
-from src.design_patterns.architectural.repository import demo as repository_demo
+# Each entry stores the dotted path of the module that defines its `demo()`.
+# Modules are imported only when their demo actually runs, so listing topics
+# or running a single demo doesn't pay for importing the whole catalog.
 
 # ---------------------------------------------------------------------------
 # OOP Concepts (learn these BEFORE design patterns!)
 # ---------------------------------------------------------------------------
 OOP_CONCEPTS: dict[str, dict] = {
-    "classes_and_objects": {"demo": classes_demo, "category": "oops", "name": "Classes & Objects"},
-    "encapsulation": {"demo": encapsulation_demo, "category": "oops", "name": "Encapsulation"},
-    "inheritance": {"demo": inheritance_demo, "category": "oops", "name": "Inheritance"},
-    "polymorphism": {"demo": polymorphism_demo, "category": "oops", "name": "Polymorphism"},
-    "abstraction": {"demo": abstraction_demo, "category": "oops", "name": "Abstraction"},
-    "composition": {"demo": composition_demo, "category": "oops", "name": "Composition vs Inheritance"},
-    "solid_principles": {"demo": solid_demo, "category": "oops", "name": "SOLID Principles"},
+    "classes_and_objects": {"module": "src.oops_concepts.classes_and_objects", "category": "oops", "name": "Classes & Objects"},
+    "encapsulation": {"module": "src.oops_concepts.encapsulation", "category": "oops", "name": "Encapsulation"},
+    "inheritance": {"module": "src.oops_concepts.inheritance", "category": "oops", "name": "Inheritance"},
+    "polymorphism": {"module": "src.oops_concepts.polymorphism", "category": "oops", "name": "Polymorphism"},
+    "abstraction": {"module": "src.oops_concepts.abstraction", "category": "oops", "name": "Abstraction"},
+    "composition": {"module": "src.oops_concepts.composition", "category": "oops", "name": "Composition vs Inheritance"},
+    "solid_principles": {"module": "src.oops_concepts.solid_principles", "category": "oops", "name": "SOLID Principles"},
 }
 
 # ---------------------------------------------------------------------------
@@ -70,31 +42,31 @@ OOP_CONCEPTS: dict[str, dict] = {
 # ---------------------------------------------------------------------------
 PATTERNS: dict[str, dict] = {
     # Creational
-    "singleton": {"demo": singleton_demo, "category": "creational", "name": "Singleton"},
-    "factory": {"demo": factory_demo, "category": "creational", "name": "Factory Method"},
-    "abstract_factory": {"demo": abstract_factory_demo, "category": "creational", "name": "Abstract Factory"},
-    "builder": {"demo": builder_demo, "category": "creational", "name": "Builder"},
-    "prototype": {"demo": prototype_demo, "category": "creational", "name": "Prototype"},
+    "singleton": {"module": "src.design_patterns.creational.singleton", "category": "creational", "name": "Singleton"},
+    "factory": {"module": "src.design_patterns.creational.factory", "category": "creational", "name": "Factory Method"},
+    "abstract_factory": {"module": "src.design_patterns.creational.abstract_factory", "category": "creational", "name": "Abstract Factory"},
+    "builder": {"module": "src.design_patterns.creational.builder", "category": "creational", "name": "Builder"},
+    "prototype": {"module": "src.design_patterns.creational.prototype", "category": "creational", "name": "Prototype"},
     # Structural
-    "adapter": {"demo": adapter_demo, "category": "structural", "name": "Adapter"},
-    "decorator": {"demo": decorator_demo, "category": "structural", "name": "Decorator"},
-    "facade": {"demo": facade_demo, "category": "structural", "name": "Facade"},
-    "proxy": {"demo": proxy_demo, "category": "structural", "name": "Proxy"},
-    "composite": {"demo": composite_demo, "category": "structural", "name": "Composite"},
-    "bridge": {"demo": bridge_demo, "category": "structural", "name": "Bridge"},
+    "adapter": {"module": "src.design_patterns.structural.adapter", "category": "structural", "name": "Adapter"},
+    "decorator": {"module": "src.design_patterns.structural.decorator", "category": "structural", "name": "Decorator"},
+    "facade": {"module": "src.design_patterns.structural.facade", "category": "structural", "name": "Facade"},
+    "proxy": {"module": "src.design_patterns.structural.proxy", "category": "structural", "name": "Proxy"},
+    "composite": {"module": "src.design_patterns.structural.composite", "category": "structural", "name": "Composite"},
+    "bridge": {"module": "src.design_patterns.structural.bridge", "category": "structural", "name": "Bridge"},
     # Behavioral
-    "strategy": {"demo": strategy_demo, "category": "behavioral", "name": "Strategy"},
-    "observer": {"demo": observer_demo, "category": "behavioral", "name": "Observer"},
-    "chain_of_responsibility": {"demo": chain_demo, "category": "behavioral", "name": "Chain of Responsibility"},
-    "command": {"demo": command_demo, "category": "behavioral", "name": "Command"},
-    "state": {"demo": state_demo, "category": "behavioral", "name": "State"},
-    "template_method": {"demo": template_method_demo, "category": "behavioral", "name": "Template Method"},
-    "iterator": {"demo": iterator_demo, "category": "behavioral", "name": "Iterator"},
-    "mediator": {"demo": mediator_demo, "category": "behavioral", "name": "Mediator"},
+    "strategy": {"module": "src.design_patterns.behavioral.strategy", "category": "behavioral", "name": "Strategy"},
+    "observer": {"module": "src.design_patterns.behavioral.observer", "category": "behavioral", "name": "Observer"},
+    "chain_of_responsibility": {"module": "src.design_patterns.behavioral.chain_of_responsibility", "category": "behavioral", "name": "Chain of Responsibility"},
+    "command": {"module": "src.design_patterns.behavioral.command", "category": "behavioral", "name": "Command"},
+    "state": {"module": "src.design_patterns.behavioral.state", "category": "behavioral", "name": "State"},
+    "template_method": {"module": "src.design_patterns.behavioral.template_method", "category": "behavioral", "name": "Template Method"},
+    "iterator": {"module": "src.design_patterns.behavioral.iterator", "category": "behavioral", "name": "Iterator"},
+    "mediator": {"module": "src.design_patterns.behavioral.mediator", "category": "behavioral", "name": "Mediator"},
     # Architectural
-    "mvc": {"demo": mvc_demo, "category": "architectural", "name": "MVC"},
-    "dependency_injection": {"demo": di_demo, "category": "architectural", "name": "Dependency Injection"},
-    "repository": {"demo": repository_demo, "category": "architectural", "name": "Repository"},
+    "mvc": {"module": "src.design_patterns.architectural.mvc", "category": "architectural", "name": "MVC"},
+    "dependency_injection": {"module": "src.design_patterns.architectural.dependency_injection", "category": "architectural", "name": "Dependency Injection"},
+    "repository": {"module": "src.design_patterns.architectural.repository", "category": "architectural", "name": "Repository"},
 }
 
 # Merged lookup for running individual demos by name
@@ -102,32 +74,67 @@ ALL_DEMOS: dict[str, dict] = {**OOP_CONCEPTS, **PATTERNS}
 
 PATTERN_CATEGORIES = ["creational", "structural", "behavioral", "architectural"]
 ALL_CATEGORIES = ["oops"] + PATTERN_CATEGORIES
+_ALL_CATEGORIES_SET = frozenset(ALL_CATEGORIES)
+
+# Patterns grouped by category once, so listing/running a category needs no filtering
+_BY_CATEGORY: dict[str, list[tuple[str, dict]]] = {c: [] for c in PATTERN_CATEGORIES}
+for _key, _info in PATTERNS.items():
+    _BY_CATEGORY[_info["category"]].append((_key, _info))
+
+
+def _show_demo_logs() -> None:
+    """
+    Print the DEBUG messages some demos narrate their steps with (chain of
+    responsibility, mediator, template method) as plain lines on stdout.
+    Only the demo modules' loggers are opened up, not the whole root logger.
+    """
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logging.getLogger("src").setLevel(logging.DEBUG)
+
+
+@cache
+def _load_demo(module: str) -> Callable[[], None]:
+    """Import a demo module on first use and return its `demo` function."""
+    return importlib.import_module(module).demo
 
 
 def list_patterns() -> None:
     """Print all available OOP concepts and patterns grouped by category."""
-    print("\n" + "=" * 60)
-    print("  🎨 DESIGN PATTERNS & OOP CONCEPTS IN PYTHON")
-    print("  A Comprehensive Learning Collection")
-    print("=" * 60)
+    # Build the whole listing first, then write it to stdout in one go
+    out: list[str] = [
+        "\n" + "=" * 60,
+        "  🎨 DESIGN PATTERNS & OOP CONCEPTS IN PYTHON",
+        "  A Comprehensive Learning Collection",
+        "=" * 60,
+    ]
 
     # OOP Concepts first
-    print(f"\n  📚 OOP CONCEPTS (Start Here!)")
-    print(f"  {'─' * 50}")
-    for key, info in OOP_CONCEPTS.items():
-        print(f"    • {info['name']:<35} → python -m examples.runner {key}")
+    out.append("\n  📚 OOP CONCEPTS (Start Here!)")
+    out.append(f"  {'─' * 50}")
+    out.extend(
+        f"    • {info['name']:<35} → python -m examples.runner {key}"
+        for key, info in OOP_CONCEPTS.items()
+    )
 
     # Design Patterns by category
     for category in PATTERN_CATEGORIES:
-        patterns = {k: v for k, v in PATTERNS.items() if v["category"] == category}
-        print(f"\n  📂 {category.upper()} PATTERNS")
-        print(f"  {'─' * 50}")
-        for key, info in patterns.items():
-            print(f"    • {info['name']:<35} → python -m examples.runner {key}")
-
-    print(f"\n  💡 Run all OOP concepts:  python -m examples.runner oops")
-    print(f"  💡 Run by category:      python -m examples.runner creational")
-    print(f"  💡 Run ALL demos:        python -m examples.runner all")
+        out.append(f"\n  📂 {category.upper()} PATTERNS")
+        out.append(f"  {'─' * 50}")
+        out.extend(
+            f"    • {info['name']:<35} → python -m examples.runner {key}"
+            for key, info in _BY_CATEGORY[category]
+        )
+
+    out.append("\n  💡 Run all OOP concepts:  python -m examples.runner oops")
+    out.append("  💡 Run by category:      python -m examples.runner creational")
+    out.append("  💡 Run ALL demos:        python -m examples.runner all")
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _invoke(demo_info: dict) -> None:
+    """Run the demo described by a registry entry."""
+    _load_demo(demo_info["module"])()
     print()
 
 
@@ -135,8 +142,7 @@ def run_demo(name: str) -> None:
     """Run a specific OOP concept or pattern demo."""
     demo_info = ALL_DEMOS.get(name.lower())
     if demo_info:
-        demo_info["demo"]()
-        print()
+        _invoke(demo_info)
     else:
         print(f"  ❌ Unknown topic: '{name}'")
         print(f"  Available: {', '.join(ALL_DEMOS.keys())}")
@@ -145,35 +151,36 @@ def run_demo(name: str) -> None:
 def run_category(category: str) -> None:
     """Run all demos in a category."""
     if category == "oops":
-        for key in OOP_CONCEPTS:
-            run_demo(key)
+        for info in OOP_CONCEPTS.values():
+            _invoke(info)
     else:
-        patterns = {k: v for k, v in PATTERNS.items() if v["category"] == category}
+        patterns = _BY_CATEGORY.get(category)
         if not patterns:
             print(f"  ❌ Unknown category: '{category}'")
             return
-        for key in patterns:
-            run_demo(key)
+        for _, info in patterns:
+            _invoke(info)
 
 
 def run_all() -> None:
     """Run all demos (OOP concepts first, then patterns)."""
-    for key in OOP_CONCEPTS:
-        run_demo(key)
-    for key in PATTERNS:
-        run_demo(key)
+    for info in OOP_CONCEPTS.values():
+        _invoke(info)
+    for info in PATTERNS.values():
+        _invoke(info)
 
 
 def main() -> None:
     """Main entry point."""
-    args = sys.argv[1:]
+    args = [arg.lower() for arg in sys.argv[1:]]
+    _show_demo_logs()
 
     if not args:
         list_patterns()
-    elif args[0].lower() == "all":
+    elif args[0] == "all":
         run_all()
-    elif args[0].lower() in ALL_CATEGORIES:
-        run_category(args[0].lower())
+    elif args[0] in _ALL_CATEGORIES_SET:
+        run_category(args[0])
     else:
         for arg in args:
             run_demo(arg)
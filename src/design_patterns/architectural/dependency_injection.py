@@ -12,8 +12,9 @@ The chef just cooks with whatever ingredients arrive.
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import defaultdict
 from typing import Any
 
 
@@ -25,6 +26,8 @@ from typing import Any
 class MessageSender(ABC):
     """Interface for sending messages — the DEPENDENCY."""
 
+    __slots__ = ()
+
     @abstractmethod
     def send(self, recipient: str, subject: str, body: str) -> str:
         ...
@@ -33,6 +36,8 @@ class MessageSender(ABC):
 class EmailSender(MessageSender):
     """Real email sender (would use SMTP in production)."""
 
+    __slots__ = ()
+
     def send(self, recipient: str, subject: str, body: str) -> str:
         return f"📧 Email sent to {recipient}: [{subject}] {body}"
 
@@ -40,6 +45,8 @@ class EmailSender(MessageSender):
 class SMSSender(MessageSender):
     """Real SMS sender (would use Twilio in production)."""
 
+    __slots__ = ()
+
     def send(self, recipient: str, subject: str, body: str) -> str:
         return f"📱 SMS sent to {recipient}: {subject} — {body}"
 
@@ -52,6 +59,8 @@ class MockSender(MessageSender):
     instead of the real one. No real emails are sent during tests!
     """
 
+    __slots__ = ("sent_messages",)
+
     def __init__(self) -> None:
         self.sent_messages: list[dict] = []
 
@@ -82,6 +91,8 @@ class NotificationService:
         electric) without redesigning the engine!
     """
 
+    __slots__ = ("_sender",)
+
     def __init__(self, sender: MessageSender) -> None:
         # The sender is INJECTED — not created here!
         self._sender = sender
@@ -112,6 +123,8 @@ class NotificationService:
 # Real-World Example 2: Service Container (Simple DI Container)
 # ---------------------------------------------------------------------------
 
+_SINGLETON, _FACTORY = 0, 1
+
 
 class ServiceContainer:
     """
@@ -123,29 +136,52 @@ class ServiceContainer:
         The toolbox decides WHICH specific tool to give each worker.
     """
 
+    __slots__ = ("_entries", "_sealed")
+
     def __init__(self) -> None:
-        self._services: dict[str, Any] = {}
-        self._factories: dict[str, Any] = {}
+        # One dict for everything: name → (kind, singleton instance or factory)
+        self._entries: dict[str, tuple[int, Any]] = {}
+        self._sealed = False
+
+    def seal(self) -> None:
+        """
+        Freeze the registrations once startup wiring is done.
+
+        After this the container is read-only: resolve() keeps working,
+        but registering (or overriding) a service raises an error.
+        """
+        self._sealed = True
+
+    def _check_not_sealed(self, name: str) -> None:
+        if self._sealed:
+            raise RuntimeError(f"Cannot register '{name}': container is sealed")
 
     def register_singleton(self, name: str, instance: Any) -> None:
         """Register a single shared instance (singleton)."""
-        self._services[name] = instance
+        self._check_not_sealed(name)
+        self._entries[sys.intern(name)] = (_SINGLETON, instance)
 
     def register_factory(self, name: str, factory: Any) -> None:
         """Register a factory that creates new instances each time."""
-        self._factories[name] = factory
+        self._check_not_sealed(name)
+        self._entries[sys.intern(name)] = (_FACTORY, factory)
 
     def resolve(self, name: str) -> Any:
-        """Get a service by name."""
-        if name in self._services:
-            return self._services[name]
-        if name in self._factories:
-            return self._factories[name]()
-        raise ValueError(f"Service '{name}' not registered")
+        """
+        Get a service by name.
+
+        Only registration interns names. A lookup is a plain dict probe:
+        interning here would add a second table lookup and speed up nothing,
+        because str hashes are cached and dict checks identity first anyway.
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            raise ValueError(f"Service '{name}' not registered")
+        kind, value = entry
+        return value if kind is _SINGLETON else value()
 
     def list_services(self) -> list[str]:
-        all_services = set(self._services.keys()) | set(self._factories.keys())
-        return sorted(all_services)
+        return sorted(self._entries)
 
 
 # ---------------------------------------------------------------------------
@@ -156,6 +192,8 @@ class ServiceContainer:
 class Database(ABC):
     """Interface for database operations."""
 
+    __slots__ = ()
+
     @abstractmethod
     def save(self, table: str, data: dict) -> str:
         ...
@@ -166,6 +204,8 @@ class Database(ABC):
 
 
 class PostgresDatabase(Database):
+    __slots__ = ()
+
     def save(self, table: str, data: dict) -> str:
         return f"🐘 PostgreSQL: Saved to '{table}' → {data}"
 
@@ -174,6 +214,8 @@ class PostgresDatabase(Database):
 
 
 class SQLiteDatabase(Database):
+    __slots__ = ()
+
     def save(self, table: str, data: dict) -> str:
         return f"📦 SQLite: Saved to '{table}' → {data}"
 
@@ -184,21 +226,23 @@ class SQLiteDatabase(Database):
 class InMemoryDatabase(Database):
     """In-memory database for testing — no real DB needed!"""
 
+    __slots__ = ("_store", "_index")
+
     def __init__(self) -> None:
-        self._store: dict[str, list[dict]] = {}
+        self._store: defaultdict[str, list[dict]] = defaultdict(list)
+        # table → {id → record}, so find() doesn't scan every row
+        self._index: defaultdict[str, dict[int, dict]] = defaultdict(dict)
 
     def save(self, table: str, data: dict) -> str:
-        if table not in self._store:
-            self._store[table] = []
         self._store[table].append(data)
+        record_id = data.get("id")
+        if record_id is not None:
+            # Keep the first record per id, matching the old linear scan
+            self._index[table].setdefault(record_id, data)
         return f"🧪 InMemory: Saved to '{table}' → {data}"
 
     def find(self, table: str, id: int) -> dict | None:
-        records = self._store.get(table, [])
-        for record in records:
-            if record.get("id") == id:
-                return record
-        return None
+        return self._index.get(table, {}).get(id)
 
 
 class UserService:
@@ -207,6 +251,8 @@ class UserService:
     Works with PostgreSQL, SQLite, or InMemory (for tests)!
     """
 
+    __slots__ = ("_db", "_notifier")
+
     def __init__(self, database: Database, notifier: NotificationService) -> None:
         self._db = database
         self._notifier = notifier
@@ -267,6 +313,7 @@ def demo() -> None:
     container.register_factory("notification_service",
                                 lambda: NotificationService(container.resolve("email_sender")))
 
+    container.seal()  # Wiring done — no more registrations from here on
     print(f"  Registered services: {container.list_services()}")
 
     db = container.resolve("database")
@@ -15,9 +15,11 @@ Think of a restaurant:
 
 from __future__ import annotations
 
+import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
+from typing import Callable, Collection, Iterable
 
 
 # ---------------------------------------------------------------------------
@@ -25,6 +27,12 @@ from enum import Enum
 # ---------------------------------------------------------------------------
 
 
+def _format_ts(ts: int) -> str:
+    """Format an epoch timestamp as "YYYY-MM-DD HH:MM" (only done when displayed)."""
+    t = time.localtime(ts)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}"
+
+
 class TaskPriority(Enum):
     LOW = "Low"
     MEDIUM = "Medium"
@@ -38,7 +46,7 @@ class TaskStatus(Enum):
     DONE = "Done"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A single task."""
     id: int
@@ -46,12 +54,12 @@ class Task:
     description: str = ""
     priority: TaskPriority = TaskPriority.MEDIUM
     status: TaskStatus = TaskStatus.TODO
-    created_at: str = ""
-    completed_at: str = ""
+    created_at: int = 0    # Epoch seconds
+    completed_at: int = 0  # Epoch seconds, 0 = not completed yet
 
     def __post_init__(self):
         if not self.created_at:
-            self.created_at = datetime.now().strftime("%Y-%m-%d %H:%M")
+            self.created_at = int(time.time())
 
 
 class TaskModel:
@@ -67,17 +75,27 @@ class TaskModel:
     def __init__(self) -> None:
         self._tasks: dict[int, Task] = {}
         self._next_id = 1
-        self._observers: list = []  # For notifying views of changes
+        # Bound on_model_changed methods of the views to notify of changes.
+        # Copy-on-write tuple: (un)subscribing swaps in a new tuple, so a
+        # notification in progress keeps iterating its own snapshot.
+        self._callbacks: tuple[Callable[[int], None], ...] = ()
+        self._version = 0  # Bumped on every change; sent along with notifications
+        # Running count of tasks per status, so stats never has to scan
+        self._status_counts: dict[TaskStatus, int] = {s: 0 for s in TaskStatus}
 
     def add_observer(self, observer) -> None:
-        self._observers.append(observer)
+        self._callbacks = self._callbacks + (observer.on_model_changed,)
+
+    def remove_observer(self, observer) -> None:
+        callback = observer.on_model_changed
+        self._callbacks = tuple(cb for cb in self._callbacks if cb != callback)
 
     def _notify_observers(self) -> None:
-        for observer in self._observers:
-            observer.on_model_changed()
+        version = self._version
+        for callback in self._callbacks:
+            callback(version)
 
-    def add_task(self, title: str, description: str = "",
-                 priority: TaskPriority = TaskPriority.MEDIUM) -> Task:
+    def _insert(self, title: str, description: str, priority: TaskPriority) -> Task:
         task = Task(
             id=self._next_id,
             title=title,
@@ -86,49 +104,72 @@ class TaskModel:
         )
         self._tasks[self._next_id] = task
         self._next_id += 1
+        self._status_counts[task.status] += 1
+        self._version += 1
+        return task
+
+    def add_task(self, title: str, description: str = "",
+                 priority: TaskPriority = TaskPriority.MEDIUM) -> Task:
+        task = self._insert(title, description, priority)
         self._notify_observers()
         return task
 
+    def add_tasks(self, specs: Iterable[tuple[str, str, TaskPriority]]) -> list[Task]:
+        """Add several (title, description, priority) tasks, notifying observers once."""
+        tasks = [self._insert(*spec) for spec in specs]
+        if tasks:
+            self._notify_observers()
+        return tasks
+
     def get_task(self, task_id: int) -> Task | None:
         return self._tasks.get(task_id)
 
-    def get_all_tasks(self) -> list[Task]:
-        return list(self._tasks.values())
+    def get_all_tasks(self) -> Collection[Task]:
+        """All tasks as a live read-only view (wrap in list() for a snapshot)."""
+        return self._tasks.values()
 
     def update_status(self, task_id: int, status: TaskStatus) -> Task | None:
         task = self._tasks.get(task_id)
         if task:
+            self._status_counts[task.status] -= 1
+            self._status_counts[status] += 1
             task.status = status
+            self._version += 1
             if status == TaskStatus.DONE:
-                task.completed_at = datetime.now().strftime("%Y-%m-%d %H:%M")
+                task.completed_at = int(time.time())
             self._notify_observers()
         return task
 
     def delete_task(self, task_id: int) -> bool:
-        if task_id in self._tasks:
-            del self._tasks[task_id]
+        task = self._tasks.pop(task_id, None)
+        if task:
+            self._status_counts[task.status] -= 1
+            self._version += 1
             self._notify_observers()
             return True
         return False
 
-    def get_tasks_by_status(self, status: TaskStatus) -> list[Task]:
-        return [t for t in self._tasks.values() if t.status == status]
+    def get_tasks_by_status(self, *statuses: TaskStatus) -> list[Task]:
+        """Tasks in any of the given statuses, e.g. (TODO, IN_PROGRESS) in one pass."""
+        return [t for t in self._tasks.values() if t.status in statuses]
 
-    def get_tasks_by_priority(self, priority: TaskPriority) -> list[Task]:
-        return [t for t in self._tasks.values() if t.priority == priority]
+    def get_tasks_by_priority(self, *priorities: TaskPriority) -> list[Task]:
+        """Tasks with any of the given priorities."""
+        return [t for t in self._tasks.values() if t.priority in priorities]
 
     @property
     def stats(self) -> dict:
+        counts = self._status_counts
         total = len(self._tasks)
-        done = len(self.get_tasks_by_status(TaskStatus.DONE))
-        in_progress = len(self.get_tasks_by_status(TaskStatus.IN_PROGRESS))
-        todo = len(self.get_tasks_by_status(TaskStatus.TODO))
+        done = counts[TaskStatus.DONE]
+        in_progress = counts[TaskStatus.IN_PROGRESS]
+        todo = counts[TaskStatus.TODO]
         return {
             "total": total,
             "done": done,
             "in_progress": in_progress,
             "todo": todo,
-            "completion_rate": f"{(done / total * 100):.0f}%" if total > 0 else "0%",
+            "completion_rate": f"{(done / total * 100):.0f}%" if total else "0%",
         }
 
 
@@ -137,6 +178,14 @@ class TaskModel:
 # ---------------------------------------------------------------------------
 
 
+_PRIORITY_ICON: dict[TaskPriority, str] = {
+    TaskPriority.LOW: "🟢",
+    TaskPriority.MEDIUM: "🟡",
+    TaskPriority.HIGH: "🟠",
+    TaskPriority.CRITICAL: "🔴",
+}
+
+
 class TaskView:
     """
     View: Displays task data to the user.
@@ -147,18 +196,25 @@ class TaskView:
         but it doesn't know how to cook (that's the model's job).
     """
 
-    def display_tasks(self, tasks: list[Task]) -> None:
+    def __init__(self) -> None:
+        self._last_seen_version = 0
+
+    def display_tasks(self, tasks: Collection[Task]) -> None:
         """Display a list of tasks."""
         if not tasks:
             print("    📭 No tasks found.")
             return
 
-        print(f"    {'ID':<5} {'Title':<25} {'Priority':<10} {'Status':<15}")
-        print(f"    {'-'*5} {'-'*25} {'-'*10} {'-'*15}")
+        # Build every row first, then write the table in one call
+        lines = [
+            f"    {'ID':<5} {'Title':<25} {'Priority':<10} {'Status':<15}",
+            f"    {'-'*5} {'-'*25} {'-'*10} {'-'*15}",
+        ]
         for task in tasks:
-            priority_icon = {"Low": "🟢", "Medium": "🟡", "High": "🟠", "Critical": "🔴"}
-            icon = priority_icon.get(task.priority.value, "⚪")
-            print(f"    {task.id:<5} {task.title:<25} {icon} {task.priority.value:<8} {task.status.value:<15}")
+            priority = task.priority
+            icon = _PRIORITY_ICON.get(priority, "⚪")
+            lines.append(f"    {task.id:<5} {task.title:<25} {icon} {priority.value:<8} {task.status.value:<15}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_task_detail(self, task: Task) -> None:
         """Display detailed view of a single task."""
@@ -167,9 +223,9 @@ class TaskView:
         print(f"       Description: {task.description or 'N/A'}")
         print(f"       Priority: {task.priority.value}")
         print(f"       Status: {task.status.value}")
-        print(f"       Created: {task.created_at}")
+        print(f"       Created: {_format_ts(task.created_at)}")
         if task.completed_at:
-            print(f"       Completed: {task.completed_at}")
+            print(f"       Completed: {_format_ts(task.completed_at)}")
 
     def display_stats(self, stats: dict) -> None:
         """Display task statistics."""
@@ -182,9 +238,12 @@ class TaskView:
         """Display a message to the user."""
         print(f"    💬 {message}")
 
-    def on_model_changed(self) -> None:
+    def on_model_changed(self, version: int) -> None:
         """Called when the model changes (observer)."""
-        pass  # In a real app, this would trigger a re-render
+        if version <= self._last_seen_version:
+            return  # Already showing this version (or a newer one)
+        self._last_seen_version = version
+        # In a real app, this would trigger a re-render
 
 
 # ---------------------------------------------------------------------------
@@ -202,6 +261,13 @@ class TaskController:
         to the table (update view).
     """
 
+    _PRIORITY_MAP = {
+        "low": TaskPriority.LOW,
+        "medium": TaskPriority.MEDIUM,
+        "high": TaskPriority.HIGH,
+        "critical": TaskPriority.CRITICAL,
+    }
+
     def __init__(self, model: TaskModel, view: TaskView) -> None:
         self._model = model
         self._view = view
@@ -210,16 +276,22 @@ class TaskController:
     def create_task(self, title: str, description: str = "",
                     priority: str = "medium") -> None:
         """Handle creating a new task."""
-        priority_map = {
-            "low": TaskPriority.LOW,
-            "medium": TaskPriority.MEDIUM,
-            "high": TaskPriority.HIGH,
-            "critical": TaskPriority.CRITICAL,
-        }
-        task_priority = priority_map.get(priority.lower(), TaskPriority.MEDIUM)
-        task = self._model.add_task(title, description, task_priority)
+        task = self._model.add_task(title, description, self._parse_priority(priority))
         self._view.display_message(f"Task '{task.title}' created (ID: {task.id})")
 
+    def create_tasks(self, specs: Iterable[tuple[str, str, str]]) -> None:
+        """Handle creating several (title, description, priority) tasks at once."""
+        tasks = self._model.add_tasks(
+            (title, description, self._parse_priority(priority))
+            for title, description, priority in specs
+        )
+        for task in tasks:
+            self._view.display_message(f"Task '{task.title}' created (ID: {task.id})")
+
+    @classmethod
+    def _parse_priority(cls, priority: str) -> TaskPriority:
+        return cls._PRIORITY_MAP.get(priority.lower(), TaskPriority.MEDIUM)
+
     def complete_task(self, task_id: int) -> None:
         """Mark a task as done."""
         task = self._model.update_status(task_id, TaskStatus.DONE)
@@ -282,10 +354,12 @@ def demo() -> None:
 
     # User actions (handled by Controller)
     print("\n  Creating tasks...")
-    controller.create_task("Design database schema", "Create ERD for user module", "high")
-    controller.create_task("Write API endpoints", "REST API for user CRUD", "critical")
-    controller.create_task("Setup CI/CD pipeline", "GitHub Actions config", "medium")
-    controller.create_task("Write unit tests", "Pytest for all services", "high")
+    controller.create_tasks([
+        ("Design database schema", "Create ERD for user module", "high"),
+        ("Write API endpoints", "REST API for user CRUD", "critical"),
+        ("Setup CI/CD pipeline", "GitHub Actions config", "medium"),
+        ("Write unit tests", "Pytest for all services", "high"),
+    ])  # Bulk add — the view is notified once for the whole batch
     controller.create_task("Update README", "Add setup instructions", "low")
 
     # Show all tasks
@@ -12,10 +12,11 @@ You don't need to know WHERE or HOW the book is stored.
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import time
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import TypeVar, Generic
+from math import inf
+from typing import Collection, Iterable, Protocol, TypeVar
 
 T = TypeVar("T")
 
@@ -25,7 +26,7 @@ T = TypeVar("T")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User domain model."""
     id: int | None = None
@@ -33,18 +34,18 @@ class User:
     email: str = ""
     full_name: str = ""
     is_active: bool = True
-    created_at: str = ""
+    created_at: int = 0  # Epoch seconds
 
     def __post_init__(self):
         if not self.created_at:
-            self.created_at = datetime.now().strftime("%Y-%m-%d %H:%M")
+            self.created_at = int(time.time())
 
     def __str__(self) -> str:
         status = "✅" if self.is_active else "❌"
         return f"{status} User(id={self.id}, username='{self.username}', email='{self.email}')"
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     """Product domain model."""
     id: int | None = None
@@ -58,11 +59,11 @@ class Product:
 
 
 # ---------------------------------------------------------------------------
-# Repository Interface (Abstract)
+# Repository Interface (Protocol)
 # ---------------------------------------------------------------------------
 
 
-class Repository(ABC, Generic[T]):
+class Repository(Protocol[T]):
     """
     Generic repository interface — defines standard data operations.
 
@@ -76,29 +77,31 @@ class Repository(ABC, Generic[T]):
         - Remove a book
 
         HOW they do it depends on the library system (shelves, digital, etc.)
+
+    This is a Protocol: any class with these methods IS a repository —
+    no need to inherit from it (structural typing, checked by type checkers).
     """
 
-    @abstractmethod
     def find_by_id(self, id: int) -> T | None:
         """Find an entity by its ID."""
         ...
 
-    @abstractmethod
-    def find_all(self) -> list[T]:
-        """Get all entities."""
+    def find_all(self) -> Collection[T]:
+        """Get all entities (a live read-only view — wrap in list() for a snapshot)."""
         ...
 
-    @abstractmethod
     def add(self, entity: T) -> T:
         """Add a new entity."""
         ...
 
-    @abstractmethod
+    def add_many(self, entities: Iterable[T]) -> list[T]:
+        """Add several entities at once — all or nothing."""
+        ...
+
     def update(self, entity: T) -> T:
         """Update an existing entity."""
         ...
 
-    @abstractmethod
     def delete(self, id: int) -> bool:
         """Delete an entity by ID."""
         ...
@@ -109,102 +112,213 @@ class Repository(ABC, Generic[T]):
 # ---------------------------------------------------------------------------
 
 
-class InMemoryUserRepository(Repository[User]):
+class InMemoryUserRepository:
     """
     In-memory user repository — stores users in a dictionary.
 
     Real-life analogy:
         A small notebook where the librarian writes down book information.
         Fast and easy, but the data is lost when you close the notebook (restart app).
+
+    Usernames and emails are unique: `add`, `add_many` and `update` raise
+    ValueError instead of storing a user whose non-empty username or email
+    already belongs to someone else.
     """
 
     def __init__(self) -> None:
         self._users: dict[int, User] = {}
         self._next_id = 1
+        # Secondary indexes (username/email → id) for O(1) lookups
+        self._by_username: dict[str, int] = {}
+        self._by_email: dict[str, int] = {}
+        self._indexed_keys: dict[int, tuple[str, str]] = {}  # id → (username, email)
+        self._active_ids: set[int] = set()
+
+    def _check_unique(self, user: User, user_id: int | None) -> None:
+        for index, key, label in ((self._by_username, user.username, "username"),
+                                  (self._by_email, user.email, "email")):
+            owner = index.get(key)
+            if key and owner is not None and owner != user_id:
+                raise ValueError(f"User with {label} '{key}' already exists")
+
+    def _index(self, user: User) -> None:
+        if user.username:
+            self._by_username[user.username] = user.id
+        if user.email:
+            self._by_email[user.email] = user.id
+        self._indexed_keys[user.id] = (user.username, user.email)
+        if user.is_active:
+            self._active_ids.add(user.id)
+        else:
+            self._active_ids.discard(user.id)
+
+    def _unindex(self, user_id: int) -> None:
+        username, email = self._indexed_keys.pop(user_id)
+        self._by_username.pop(username, None)
+        self._by_email.pop(email, None)
+        self._active_ids.discard(user_id)
 
     def find_by_id(self, id: int) -> User | None:
         return self._users.get(id)
 
-    def find_all(self) -> list[User]:
-        return list(self._users.values())
+    def find_all(self) -> Collection[User]:
+        return self._users.values()
 
     def add(self, user: User) -> User:
+        """Store a new user. Raises ValueError if the username or email is taken."""
+        self._check_unique(user, None)
+        return self._insert(user)
+
+    def _insert(self, user: User) -> User:
         user.id = self._next_id
         self._users[self._next_id] = user
         self._next_id += 1
+        self._index(user)
         return user
 
+    def add_many(self, users: Iterable[User]) -> list[User]:
+        """
+        Add several users in one call — all or nothing.
+
+        The whole batch is checked first (against stored users and against
+        itself), so a duplicate raises ValueError before any user is stored.
+        """
+        users = list(users)
+        usernames: set[str] = set()
+        emails: set[str] = set()
+        for user in users:
+            self._check_unique(user, None)
+            for seen, key, label in ((usernames, user.username, "username"),
+                                     (emails, user.email, "email")):
+                if key and key in seen:
+                    raise ValueError(f"User with {label} '{key}' appears twice in the batch")
+                seen.add(key)
+        return [self._insert(user) for user in users]
+
     def update(self, user: User) -> User:
+        """
+        Replace a stored user. Raises ValueError if the id is unknown or the
+        new username/email belongs to another user; if the stored user was
+        edited in place, its old username/email are restored first.
+        """
         if user.id and user.id in self._users:
+            try:
+                self._check_unique(user, user.id)
+            except ValueError:
+                if self._users[user.id] is user:
+                    # Edited in place: put the old keys back so the stored
+                    # user still matches the indexes
+                    user.username, user.email = self._indexed_keys[user.id]
+                raise
+            self._unindex(user.id)
             self._users[user.id] = user
+            self._index(user)
             return user
         raise ValueError(f"User with id {user.id} not found")
 
     def delete(self, id: int) -> bool:
         if id in self._users:
             del self._users[id]
+            self._unindex(id)
             return True
         return False
 
     # Custom query methods
     def find_by_username(self, username: str) -> User | None:
-        for user in self._users.values():
-            if user.username == username:
-                return user
-        return None
+        return self._users.get(self._by_username.get(username))
 
     def find_by_email(self, email: str) -> User | None:
-        for user in self._users.values():
-            if user.email == email:
-                return user
-        return None
+        return self._users.get(self._by_email.get(email))
 
     def find_active_users(self) -> list[User]:
-        return [u for u in self._users.values() if u.is_active]
+        if len(self._active_ids) * 8 > len(self._users):
+            # More than ~1 in 8 users match: one ordered pass beats sorting the ids
+            return [u for u in self._users.values() if u.is_active]
+        # Ids are handed out in order, so sorting keeps insertion order
+        return [self._users[i] for i in sorted(self._active_ids)]
 
 
-class InMemoryProductRepository(Repository[Product]):
+class InMemoryProductRepository:
     """In-memory product repository."""
 
     def __init__(self) -> None:
         self._products: dict[int, Product] = {}
         self._next_id = 1
+        self._in_stock_ids: set[int] = set()
+        self._by_category: dict[str, set[int]] = {}
+        self._by_price: list[tuple[float, int]] = []  # (price, id), kept sorted
+        self._indexed_keys: dict[int, tuple[str, float]] = {}  # id → (category, price)
+
+    def _index(self, product: Product) -> None:
+        self._by_category.setdefault(product.category, set()).add(product.id)
+        insort(self._by_price, (product.price, product.id))
+        self._indexed_keys[product.id] = (product.category, product.price)
+        if product.stock > 0:
+            self._in_stock_ids.add(product.id)
+        else:
+            self._in_stock_ids.discard(product.id)
+
+    def _unindex(self, product_id: int) -> None:
+        category, price = self._indexed_keys.pop(product_id)
+        members = self._by_category[category]
+        members.discard(product_id)
+        if not members:
+            del self._by_category[category]
+        del self._by_price[bisect_left(self._by_price, (price, product_id))]
+        self._in_stock_ids.discard(product_id)
 
     def find_by_id(self, id: int) -> Product | None:
         return self._products.get(id)
 
-    def find_all(self) -> list[Product]:
-        return list(self._products.values())
+    def find_all(self) -> Collection[Product]:
+        return self._products.values()
 
     def add(self, product: Product) -> Product:
         product.id = self._next_id
         self._products[self._next_id] = product
         self._next_id += 1
+        self._index(product)
         return product
 
+    def add_many(self, products: Iterable[Product]) -> list[Product]:
+        """Add several products in one call (products have no unique keys to clash)."""
+        return [self.add(product) for product in products]
+
     def update(self, product: Product) -> Product:
         if product.id and product.id in self._products:
+            self._unindex(product.id)
             self._products[product.id] = product
+            self._index(product)
             return product
         raise ValueError(f"Product with id {product.id} not found")
 
     def delete(self, id: int) -> bool:
         if id in self._products:
             del self._products[id]
+            self._unindex(id)
             return True
         return False
 
     def find_by_category(self, category: str) -> list[Product]:
-        return [p for p in self._products.values() if p.category == category]
+        ids = self._by_category.get(category, ())
+        if len(ids) * 8 > len(self._products):
+            # More than ~1 in 8 products match: one ordered pass beats sorting the ids
+            return [p for p in self._products.values() if p.category == category]
+        return [self._products[i] for i in sorted(ids)]
 
     def find_in_stock(self) -> list[Product]:
-        return [p for p in self._products.values() if p.stock > 0]
+        if len(self._in_stock_ids) * 8 > len(self._products):
+            # More than ~1 in 8 products match: one ordered pass beats sorting the ids
+            return [p for p in self._products.values() if p.stock > 0]
+        return [self._products[i] for i in sorted(self._in_stock_ids)]
 
     def find_by_price_range(self, min_price: float, max_price: float) -> list[Product]:
-        return [
-            p for p in self._products.values()
-            if min_price <= p.price <= max_price
-        ]
+        lo = bisect_left(self._by_price, (min_price, -inf))
+        hi = bisect_right(self._by_price, (max_price, inf))
+        if hi - lo > len(self._by_price) // 2:
+            # Most of the catalog matches: one ordered pass beats sorting the ids
+            return [p for p in self._products.values() if min_price <= p.price <= max_price]
+        return [self._products[i] for i in sorted(i for _, i in self._by_price[lo:hi])]
 
 
 # ---------------------------------------------------------------------------
@@ -228,6 +342,13 @@ class UserService:
         user = User(username=username, email=email, full_name=full_name)
         return self._repo.add(user)
 
+    def register_users(self, users: Iterable[tuple[str, str, str]]) -> list[User]:
+        """Register (username, email, full_name) triples in one all-or-nothing batch."""
+        return self._repo.add_many(
+            User(username=username, email=email, full_name=full_name)
+            for username, email, full_name in users
+        )
+
     def deactivate_user(self, user_id: int) -> User | None:
         user = self._repo.find_by_id(user_id)
         if user:
@@ -235,7 +356,7 @@ class UserService:
             return self._repo.update(user)
         return None
 
-    def get_all_users(self) -> list[User]:
+    def get_all_users(self) -> Collection[User]:
         return self._repo.find_all()
 
     def find_user(self, user_id: int) -> User | None:
@@ -279,9 +400,12 @@ def demo() -> None:
 
     # Register users
     print("\n  Registering users:")
-    alice = user_service.register_user("alice", "alice@example.com", "Alice Johnson")
-    bob = user_service.register_user("bob", "bob@example.com", "Bob Smith")
-    charlie = user_service.register_user("charlie", "charlie@example.com", "Charlie Brown")
+    # One all-or-nothing batch: a duplicate would store none of them
+    alice, bob, charlie = user_service.register_users([
+        ("alice", "alice@example.com", "Alice Johnson"),
+        ("bob", "bob@example.com", "Bob Smith"),
+        ("charlie", "charlie@example.com", "Charlie Brown"),
+    ])
     print(f"    {alice}")
     print(f"    {bob}")
     print(f"    {charlie}")
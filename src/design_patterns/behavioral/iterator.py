@@ -12,6 +12,9 @@ The iterator gives you a simple way to navigate.
 
 from __future__ import annotations
 
+import random
+from functools import cached_property
+from itertools import islice
 from abc import ABC, abstractmethod
 from typing import Any, Iterator
 
@@ -30,8 +33,7 @@ class Song:
         self.duration = duration_seconds
 
     def __str__(self) -> str:
-        minutes = self.duration // 60
-        seconds = self.duration % 60
+        minutes, seconds = divmod(self.duration, 60)
         return f"🎵 {self.title} — {self.artist} ({minutes}:{seconds:02d})"
 
 
@@ -47,20 +49,34 @@ class Playlist:
     def __init__(self, name: str) -> None:
         self.name = name
         self._songs: list[Song] = []
+        self._total_duration = 0  # Running sum, kept up to date by add_song
 
     def add_song(self, song: Song) -> None:
         self._songs.append(song)
+        self._total_duration += song.duration
+
+    @property
+    def total_duration(self) -> int:
+        """Total playing time in seconds."""
+        return self._total_duration
+
+    def songs_longer_than(self, seconds: int) -> list[Song]:
+        return [song for song in self._songs if song.duration > seconds]
 
     def __len__(self) -> int:
         return len(self._songs)
 
-    def __iter__(self) -> PlaylistIterator:
-        """Return a forward iterator."""
+    def __iter__(self) -> Iterator[Song]:
+        """Return a forward iterator (Python's built-in list iterator)."""
+        return iter(self._songs)
+
+    def iterator(self) -> PlaylistIterator:
+        """Return a hand-written forward iterator that also offers has_next()."""
         return PlaylistIterator(self._songs)
 
-    def reverse_iterator(self) -> ReversePlaylistIterator:
-        """Return a reverse iterator."""
-        return ReversePlaylistIterator(self._songs)
+    def reverse_iterator(self) -> Iterator[Song]:
+        """Return a reverse iterator (Python's built-in reversed list iterator)."""
+        return reversed(self._songs)
 
     def shuffle_iterator(self) -> ShufflePlaylistIterator:
         """Return a shuffle iterator."""
@@ -89,7 +105,12 @@ class PlaylistIterator:
 
 
 class ReversePlaylistIterator:
-    """Iterates through songs in reverse order."""
+    """
+    Iterates through songs in reverse order.
+
+    Playlist.reverse_iterator() uses the built-in reversed() instead;
+    this class shows what such an iterator looks like when written by hand.
+    """
 
     def __init__(self, songs: list[Song]) -> None:
         self._songs = songs
@@ -107,23 +128,30 @@ class ReversePlaylistIterator:
 
 
 class ShufflePlaylistIterator:
-    """Iterates through songs in random order."""
+    """
+    Iterates through songs in random order.
+
+    Shuffles lazily (Fisher-Yates, one step per song played) over song
+    positions, so nothing is copied or shuffled up front.
+    """
 
     def __init__(self, songs: list[Song]) -> None:
-        import random
-        self._songs = songs.copy()
-        random.shuffle(self._songs)
+        self._songs = songs
+        self._order = list(range(len(songs)))  # Positions, shuffled as we go
         self._index = 0
 
     def __iter__(self) -> ShufflePlaylistIterator:
         return self
 
     def __next__(self) -> Song:
-        if self._index >= len(self._songs):
+        i = self._index
+        order = self._order
+        if i >= len(order):
             raise StopIteration
-        song = self._songs[self._index]
-        self._index += 1
-        return song
+        j = random.randrange(i, len(order))
+        order[i], order[j] = order[j], order[i]
+        self._index = i + 1
+        return self._songs[order[i]]
 
 
 # ---------------------------------------------------------------------------
@@ -143,21 +171,18 @@ class PaginatedIterator:
     def __init__(self, all_items: list[Any], page_size: int = 3) -> None:
         self._items = all_items
         self._page_size = page_size
-        self._current_page = 0
+        self._remaining = iter(all_items)  # Items not yet handed out
 
     def __iter__(self) -> PaginatedIterator:
         return self
 
     def __next__(self) -> list[Any]:
-        start = self._current_page * self._page_size
-        if start >= len(self._items):
+        page = list(islice(self._remaining, self._page_size))
+        if not page:
             raise StopIteration
-        end = min(start + self._page_size, len(self._items))
-        page = self._items[start:end]
-        self._current_page += 1
         return page
 
-    @property
+    @cached_property
     def total_pages(self) -> int:
         return -(-len(self._items) // self._page_size)  # Ceiling division
 
@@ -184,6 +209,9 @@ def demo() -> None:
     playlist.add_song(Song("Stairway to Heaven", "Led Zeppelin", 482))
     playlist.add_song(Song("Hey Jude", "The Beatles", 431))
 
+    minutes, seconds = divmod(playlist.total_duration, 60)
+    print(f"\n  ⏱️  {len(playlist)} songs, {minutes}:{seconds:02d} total")
+
     # Normal iteration (using Python's for loop!)
     print(f"\n  ▶️  Playing '{playlist.name}' (forward):")
     for song in playlist:
@@ -12,9 +12,18 @@ which coordinates takeoffs, landings, and movements safely.
 
 from __future__ import annotations
 
+import logging
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Callable
+
+
+# Chat users and smart-home devices narrate messages and actions at DEBUG
+# level, so routing through the mediator stays quiet unless someone listens
+# (the demo runner turns them on).
+log = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -55,14 +64,14 @@ class ChatUser:
     def send(self, message: str) -> None:
         """Send a message through the mediator (chat room)."""
         if self._mediator:
-            print(f"    📤 {self.name} sends: \"{message}\"")
+            log.debug('    📤 %s sends: "%s"', self.name, message)
             self._mediator.send_message(message, self)
 
     def receive(self, message: str, sender_name: str) -> None:
         """Receive a message from the chat room."""
         formatted = f"[{sender_name}]: {message}"
         self.received_messages.append(formatted)
-        print(f"    📥 {self.name} received: {formatted}")
+        log.debug("    📥 %s received: %s", self.name, formatted)
 
 
 class ChatRoom(ChatMediator):
@@ -78,12 +87,12 @@ class ChatRoom(ChatMediator):
     def add_user(self, user: ChatUser) -> None:
         user.set_mediator(self)
         self._users.append(user)
-        print(f"  👋 {user.name} joined '{self.name}'")
+        log.debug("  👋 %s joined '%s'", user.name, self.name)
 
     def send_message(self, message: str, sender: ChatUser) -> None:
         """Broadcast message to all users EXCEPT the sender."""
         for user in self._users:
-            if user != sender:
+            if user is not sender:
                 user.receive(message, sender.name)
 
 
@@ -124,11 +133,11 @@ class SmartLight(SmartHomeDevice):
     def turn_on(self, brightness: int = 100) -> None:
         self.is_on = True
         self.brightness = brightness
-        print(f"    💡 {self.name}: ON (brightness: {brightness}%)")
+        log.debug("    💡 %s: ON (brightness: %s%%)", self.name, brightness)
 
     def turn_off(self) -> None:
         self.is_on = False
-        print(f"    💡 {self.name}: OFF")
+        log.debug("    💡 %s: OFF", self.name)
 
 
 class SmartThermostat(SmartHomeDevice):
@@ -139,11 +148,11 @@ class SmartThermostat(SmartHomeDevice):
 
     def set_temperature(self, temp: float) -> None:
         self.temperature = temp
-        print(f"    🌡️  {self.name}: Set to {temp}°C")
+        log.debug("    🌡️  %s: Set to %s°C", self.name, temp)
 
     def set_mode(self, mode: str) -> None:
         self.mode = mode
-        print(f"    🌡️  {self.name}: Mode = {mode}")
+        log.debug("    🌡️  %s: Mode = %s", self.name, mode)
 
 
 class SmartDoorLock(SmartHomeDevice):
@@ -153,12 +162,12 @@ class SmartDoorLock(SmartHomeDevice):
 
     def lock(self) -> None:
         self.is_locked = True
-        print(f"    🔒 {self.name}: LOCKED")
+        log.debug("    🔒 %s: LOCKED", self.name)
         self.notify_mediator("door_locked")
 
     def unlock(self) -> None:
         self.is_locked = False
-        print(f"    🔓 {self.name}: UNLOCKED")
+        log.debug("    🔓 %s: UNLOCKED", self.name)
         self.notify_mediator("door_unlocked")
 
 
@@ -169,11 +178,11 @@ class SecurityCamera(SmartHomeDevice):
 
     def start_recording(self) -> None:
         self.is_recording = True
-        print(f"    📹 {self.name}: Recording STARTED")
+        log.debug("    📹 %s: Recording STARTED", self.name)
 
     def stop_recording(self) -> None:
         self.is_recording = False
-        print(f"    📹 {self.name}: Recording STOPPED")
+        log.debug("    📹 %s: Recording STOPPED", self.name)
 
 
 class MotionSensor(SmartHomeDevice):
@@ -181,11 +190,11 @@ class MotionSensor(SmartHomeDevice):
         super().__init__(name)
 
     def detect_motion(self) -> None:
-        print(f"    🏃 {self.name}: Motion detected!")
+        log.debug("    🏃 %s: Motion detected!", self.name)
         self.notify_mediator("motion_detected")
 
     def detect_no_motion(self) -> None:
-        print(f"    😴 {self.name}: No motion for 30 minutes")
+        log.debug("    😴 %s: No motion for 30 minutes", self.name)
         self.notify_mediator("no_motion")
 
 
@@ -210,30 +219,42 @@ class SmartHomeController(SmartHomeMediator):
                        self.camera, self.motion_sensor]:
             device.set_mediator(self)
 
+        # Event name → reaction, so notify() is a single table lookup
+        self._handlers: dict[str, Callable[[], None]] = {
+            "motion_detected": self._on_motion_detected,
+            "no_motion": self._on_no_motion,
+            "door_unlocked": self._on_door_unlocked,
+            "door_locked": self._on_door_locked,
+        }
+
     def notify(self, sender: SmartHomeDevice, event: str) -> None:
         """React to events from devices."""
-        if event == "motion_detected":
-            print("    🏠 Controller: Motion detected! Activating home...")
-            self.light.turn_on(brightness=80)
-            self.camera.start_recording()
-
-        elif event == "no_motion":
-            print("    🏠 Controller: No activity. Entering sleep mode...")
-            self.light.turn_off()
-            self.thermostat.set_temperature(18.0)
-            self.camera.stop_recording()
-
-        elif event == "door_unlocked":
-            print("    🏠 Controller: Welcome home!")
-            self.light.turn_on()
-            self.thermostat.set_temperature(22.0)
-            self.camera.start_recording()
-
-        elif event == "door_locked":
-            print("    🏠 Controller: Goodbye! Securing home...")
-            self.light.turn_off()
-            self.thermostat.set_mode("eco")
-            self.camera.start_recording()
+        handler = self._handlers.get(event)
+        if handler:
+            handler()
+
+    def _on_motion_detected(self) -> None:
+        log.debug("    🏠 Controller: Motion detected! Activating home...")
+        self.light.turn_on(brightness=80)
+        self.camera.start_recording()
+
+    def _on_no_motion(self) -> None:
+        log.debug("    🏠 Controller: No activity. Entering sleep mode...")
+        self.light.turn_off()
+        self.thermostat.set_temperature(18.0)
+        self.camera.stop_recording()
+
+    def _on_door_unlocked(self) -> None:
+        log.debug("    🏠 Controller: Welcome home!")
+        self.light.turn_on()
+        self.thermostat.set_temperature(22.0)
+        self.camera.start_recording()
+
+    def _on_door_locked(self) -> None:
+        log.debug("    🏠 Controller: Goodbye! Securing home...")
+        self.light.turn_off()
+        self.thermostat.set_mode("eco")
+        self.camera.start_recording()
 
 
 # ---------------------------------------------------------------------------
@@ -288,4 +309,5 @@ def demo() -> None:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
     demo()
@@ -12,12 +12,21 @@ who its subscribers are — it just broadcasts the update.
 
 from __future__ import annotations
 
+import logging
+import operator
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import Iterable, Sequence
 
 
+log = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Real-World Example 1: E-Commerce Order Status Tracker
 # ---------------------------------------------------------------------------
@@ -39,8 +48,17 @@ class OrderObserver(ABC):
     Real-life analogy:
         When you order a pizza, YOU get updates, the RESTAURANT dashboard shows updates,
         and the DELIVERY DRIVER gets updates — all three are observers!
+
+    `interested_in` lists the statuses an observer cares about (None = all of
+    them). By default the order only calls an observer for those statuses;
+    that is just an optimisation — observers still ignore anything else,
+    since a caller may subscribe them with explicit `statuses`.
     """
 
+    __slots__ = ("__weakref__",)  # Allow weak subscriptions
+
+    interested_in: frozenset[OrderStatus] | None = None
+
     @abstractmethod
     def update(self, order_id: str, status: OrderStatus, details: str) -> None:
         ...
@@ -49,6 +67,8 @@ class OrderObserver(ABC):
 class CustomerNotifier(OrderObserver):
     """Notifies the customer via email/SMS."""
 
+    __slots__ = ("customer_name", "notifications")
+
     def __init__(self, customer_name: str) -> None:
         self.customer_name = customer_name
         self.notifications: list[str] = []
@@ -62,18 +82,31 @@ class CustomerNotifier(OrderObserver):
 class DashboardUpdater(OrderObserver):
     """Updates the admin dashboard in real-time."""
 
+    __slots__ = ("updates",)
+
     def __init__(self) -> None:
-        self.updates: list[dict] = []
+        self.updates: list[tuple[str, str, int]] = []  # (order_id, status, epoch ns)
+
+    @property
+    def formatted_updates(self) -> list[dict]:
+        """The updates with readable timestamps (formatted only when asked for)."""
+        return [
+            {"order_id": order_id, "status": status, "time": str(datetime.fromtimestamp(ns / 1e9))}
+            for order_id, status, ns in self.updates
+        ]
 
     def update(self, order_id: str, status: OrderStatus, details: str) -> None:
-        entry = {"order_id": order_id, "status": status.value, "time": str(datetime.now())}
-        self.updates.append(entry)
+        self.updates.append((order_id, status.value, time.time_ns()))
         print(f"    📊 Dashboard updated: {order_id} → {status.value}")
 
 
 class InventoryManager(OrderObserver):
     """Adjusts inventory when orders are placed or cancelled."""
 
+    __slots__ = ()
+
+    interested_in = frozenset((OrderStatus.CONFIRMED, OrderStatus.DELIVERED))
+
     def update(self, order_id: str, status: OrderStatus, details: str) -> None:
         if status == OrderStatus.CONFIRMED:
             print(f"    📦 Inventory: Stock reserved for {order_id}")
@@ -84,8 +117,12 @@ class InventoryManager(OrderObserver):
 class DeliveryTracker(OrderObserver):
     """Tracks deliveries for the logistics team."""
 
+    __slots__ = ()
+
+    interested_in = frozenset((OrderStatus.SHIPPED, OrderStatus.OUT_FOR_DELIVERY, OrderStatus.DELIVERED))
+
     def update(self, order_id: str, status: OrderStatus, details: str) -> None:
-        if status in (OrderStatus.SHIPPED, OrderStatus.OUT_FOR_DELIVERY, OrderStatus.DELIVERED):
+        if status in self.interested_in:
             print(f"    🚚 Delivery Team: {order_id} → {status.value}")
 
 
@@ -99,33 +136,181 @@ class Order:
     def __init__(self, order_id: str) -> None:
         self.order_id = order_id
         self._status = OrderStatus.PLACED
-        self._observers: list[OrderObserver] = []
-
-    def subscribe(self, observer: OrderObserver) -> None:
-        """Add an observer."""
-        self._observers.append(observer)
+        # One bucket per status, so a status change only reaches the observers
+        # that asked for it. Buckets are tuples replaced on (un)subscribe, so an
+        # observer that (un)subscribes while being notified can't upset the loop.
+        self._observers_by_status: dict[OrderStatus, tuple[OrderObserver, ...]] = {
+            status: () for status in OrderStatus
+        }
+
+    def subscribe(self, observer: OrderObserver,
+                  statuses: Iterable[OrderStatus] | None = None, *, weak: bool = False) -> None:
+        """
+        Add an observer for `statuses` (defaults to its `interested_in`, or all).
+
+        With `weak=True` the order doesn't keep the observer alive: once the
+        caller drops its last reference, it is unsubscribed automatically.
+        """
+        if statuses is None:
+            statuses = observer.interested_in or OrderStatus
+        entry = weakref.proxy(observer, self._drop) if weak else observer
+        buckets = self._observers_by_status
+        for status in statuses:
+            buckets[status] = buckets[status] + (entry,)
 
     def unsubscribe(self, observer: OrderObserver) -> None:
         """Remove an observer."""
-        self._observers.remove(observer)
+        buckets = self._observers_by_status
+        for status, bucket in buckets.items():
+            if observer in bucket:
+                # `!=` rather than `is not`, so weak proxies of `observer` match too
+                buckets[status] = tuple(o for o in bucket if o != observer)
+
+    def _drop(self, dead: weakref.ProxyType) -> None:
+        """Weakref callback: forget a weakly-subscribed observer that was collected."""
+        buckets = self._observers_by_status
+        for status, bucket in buckets.items():
+            buckets[status] = tuple(o for o in bucket if o is not dead)
 
     def update_status(self, status: OrderStatus, details: str = "") -> None:
-        """Change the order status — all observers get notified!"""
+        """Change the order status — observers are notified only if it actually changed."""
+        if status == self._status:
+            return
         self._status = status
         print(f"\n  🔄 Order {self.order_id} status changed to: {status.value}")
         self._notify_all(details)
 
     def _notify_all(self, details: str) -> None:
-        for observer in self._observers:
+        for observer in self._observers_by_status[self._status]:
             observer.update(self.order_id, self._status, details)
 
 
+class _ObserverWorker:
+    """Feeds one observer its events on a background thread."""
+
+    __slots__ = ("observer", "_pending", "_cond", "_busy", "_closed", "_thread")
+
+    def __init__(self, observer: OrderObserver, max_pending: int) -> None:
+        self.observer = observer
+        # Bounded: when full, appending drops the OLDEST event (keep the latest)
+        self._pending: deque[tuple[str, OrderStatus, str]] = deque(maxlen=max_pending)
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def push(self, event: tuple[str, OrderStatus, str]) -> None:
+        with self._cond:
+            self._pending.append(event)
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return  # Closed and drained
+                event = self._pending.popleft()
+                self._busy = True
+            try:
+                self.observer.update(*event)
+            except Exception:
+                # One bad event must not stop this observer's mail for good
+                log.exception("Observer %r failed on %s", self.observer, event)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Wait until every queued event has been handled."""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._pending and not self._busy)
+
+    def close(self) -> None:
+        """Handle what's left, then stop the thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+
+class QueuedOrder(Order):
+    """
+    An order whose observers are notified asynchronously.
+
+    Real-life analogy:
+        A courier dropping letters into each neighbour's mailbox instead of
+        waiting at every door until someone reads them. A slow reader only
+        delays their own mail, not everybody else's.
+
+    Each observer gets its own bounded queue and worker thread, so
+    `update_status` only appends to queues. If an observer falls more than
+    `max_pending` events behind, its oldest events are dropped and the most
+    recent ones kept. An observer that raises has the error logged and keeps
+    getting later events. Call `flush()` to wait for all observers to catch
+    up, and `close()` when done; a closed order rejects further updates.
+    """
+
+    def __init__(self, order_id: str, max_pending: int = 256) -> None:
+        super().__init__(order_id)
+        self._max_pending = max_pending
+        self._workers: dict[OrderObserver, _ObserverWorker] = {}
+        self._closed = False
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError(f"Order {self.order_id} is closed")
+
+    def subscribe(self, observer: OrderObserver,
+                  statuses: Iterable[OrderStatus] | None = None, *, weak: bool = False) -> None:
+        """
+        Add an observer (see `Order.subscribe`). Weak subscriptions aren't
+        supported: each observer's worker thread keeps it alive anyway.
+        """
+        if weak:
+            raise ValueError("QueuedOrder doesn't support weak subscriptions; "
+                             "call unsubscribe() or close() instead")
+        self._check_open()
+        super().subscribe(observer, statuses)
+        if observer not in self._workers:
+            self._workers[observer] = _ObserverWorker(observer, self._max_pending)
+
+    def unsubscribe(self, observer: OrderObserver) -> None:
+        super().unsubscribe(observer)
+        worker = self._workers.pop(observer, None)
+        if worker:
+            worker.close()
+
+    def update_status(self, status: OrderStatus, details: str = "") -> None:
+        self._check_open()
+        super().update_status(status, details)
+
+    def _notify_all(self, details: str) -> None:
+        event = (self.order_id, self._status, details)
+        for observer in self._observers_by_status[self._status]:
+            self._workers[observer].push(event)
+
+    def flush(self) -> None:
+        """Block until every observer has handled all queued events."""
+        for worker in tuple(self._workers.values()):
+            worker.flush()
+
+    def close(self) -> None:
+        """Deliver remaining events, stop all worker threads and unsubscribe."""
+        self._closed = True
+        for observer in tuple(self._workers):
+            self.unsubscribe(observer)
+
+
 # ---------------------------------------------------------------------------
 # Real-World Example 2: Stock Price Monitor
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class StockPrice:
     symbol: str
     price: float
@@ -133,26 +318,44 @@ class StockPrice:
 
 
 class StockObserver(ABC):
+    __slots__ = ("__weakref__",)  # Allow weak subscriptions
+
+    # Symbols to route to this observer by default (None = every symbol).
+    # Fixed at subscribe time, so only set it for a static watch list.
+    symbols: Iterable[str] | None = None
+
     @abstractmethod
     def on_price_change(self, stock: StockPrice) -> None:
         ...
 
+    def on_batch(self, stocks: list[StockPrice]) -> None:
+        """Handle several price changes at once (override to do it smarter)."""
+        for stock in stocks:
+            self.on_price_change(stock)
+
+
+def _never(price: float, threshold: float) -> bool:
+    return False
+
 
 class PriceAlertObserver(StockObserver):
     """Sends alert when price crosses a threshold."""
 
+    # direction → "has the price crossed the threshold?" (unknown directions never fire)
+    _CROSSED = {"above": operator.gt, "below": operator.lt}
+
+    __slots__ = ("name", "threshold", "direction", "alerts", "_crossed")
+
     def __init__(self, name: str, threshold: float, direction: str = "above") -> None:
         self.name = name
         self.threshold = threshold
         self.direction = direction
         self.alerts: list[str] = []
+        # The direction is fixed, so pick the comparison once
+        self._crossed = self._CROSSED.get(direction, _never)
 
     def on_price_change(self, stock: StockPrice) -> None:
-        triggered = (
-            (self.direction == "above" and stock.price > self.threshold)
-            or (self.direction == "below" and stock.price < self.threshold)
-        )
-        if triggered:
+        if self._crossed(stock.price, self.threshold):
             alert = f"⚠️  {self.name}: {stock.symbol} is ${stock.price:.2f} ({self.direction} ${self.threshold:.2f})"
             self.alerts.append(alert)
             print(f"    {alert}")
@@ -161,18 +364,35 @@ class PriceAlertObserver(StockObserver):
 class PortfolioTracker(StockObserver):
     """Tracks portfolio value changes."""
 
-    def __init__(self) -> None:
+    __slots__ = ("holdings", "prices", "verbose")
+
+    def __init__(self, verbose: bool = True) -> None:
         self.holdings: dict[str, int] = {}  # symbol -> quantity
         self.prices: dict[str, float] = {}
+        self.verbose = verbose  # Print a line per price change
 
     def add_holding(self, symbol: str, quantity: int) -> None:
         self.holdings[symbol] = quantity
 
+    def total_value(self) -> float:
+        """Current value of all holdings (symbols without a price yet count as 0)."""
+        prices = self.prices
+        return sum(quantity * prices.get(symbol, 0.0) for symbol, quantity in self.holdings.items())
+
     def on_price_change(self, stock: StockPrice) -> None:
         self.prices[stock.symbol] = stock.price
-        if stock.symbol in self.holdings:
-            value = stock.price * self.holdings[stock.symbol]
-            print(f"    💼 Portfolio: {self.holdings[stock.symbol]} x {stock.symbol} = ${value:,.2f}")
+        # Holdings can change after subscribing, so this tracker hears about
+        # every symbol and skips the ones it doesn't hold
+        if self.verbose and stock.symbol in self.holdings:
+            quantity = self.holdings[stock.symbol]
+            value = stock.price * quantity
+            print(f"    💼 Portfolio: {quantity} x {stock.symbol} = ${value:,.2f}")
+
+    def on_batch(self, stocks: list[StockPrice]) -> None:
+        if self.verbose:
+            super().on_batch(stocks)
+        else:
+            self.prices.update((stock.symbol, stock.price) for stock in stocks)
 
 
 @dataclass
@@ -180,22 +400,89 @@ class StockMarket:
     """Subject: The stock market that notifies observers of price changes."""
 
     _stocks: dict[str, StockPrice] = field(default_factory=dict)
-    _observers: list[StockObserver] = field(default_factory=list)
-
-    def subscribe(self, observer: StockObserver) -> None:
-        self._observers.append(observer)
-
-    def update_price(self, symbol: str, new_price: float) -> None:
-        old_price = self._stocks.get(symbol, StockPrice(symbol, new_price)).price
-        change = new_price - old_price
+    # Copy-on-write tuples, as in Order
+    _observers: tuple[StockObserver, ...] = ()  # Watch every symbol
+    _observers_by_symbol: dict[str, tuple[StockObserver, ...]] = field(default_factory=dict)
+
+    def subscribe(self, observer: StockObserver, symbols: Iterable[str] | None = None,
+                  *, weak: bool = False) -> None:
+        """
+        Add an observer for `symbols` (defaults to its `symbols`, or all).
+
+        With `weak=True` the market doesn't keep the observer alive (see
+        `Order.subscribe`).
+        """
+        if symbols is None:
+            symbols = observer.symbols
+        entry = weakref.proxy(observer, self._drop) if weak else observer
+        if symbols is None:
+            self._observers = self._observers + (entry,)
+            return
+        buckets = self._observers_by_symbol
+        for symbol in symbols:
+            buckets[symbol] = buckets.get(symbol, ()) + (entry,)
+
+    def _drop(self, dead: weakref.ProxyType) -> None:
+        """Weakref callback: forget a weakly-subscribed observer that was collected."""
+        self._observers = tuple(o for o in self._observers if o is not dead)
+        buckets = self._observers_by_symbol
+        for symbol, bucket in buckets.items():
+            buckets[symbol] = tuple(o for o in bucket if o is not dead)
+
+    def _record(self, symbol: str, new_price: float, min_delta: float) -> StockPrice | None:
+        """Store the new price and announce the tick (None if it didn't move enough)."""
+        old = self._stocks.get(symbol)
+        change = new_price - old.price if old else 0.0
+        if old and abs(change) <= min_delta:
+            return None
         stock = StockPrice(symbol, new_price, change)
         self._stocks[symbol] = stock
 
         direction = "📈" if change >= 0 else "📉"
         print(f"\n  {direction} {symbol}: ${new_price:.2f} ({change:+.2f})")
+        return stock
+
+    def update_price(self, symbol: str, new_price: float, min_delta: float = 0.0) -> None:
+        """
+        Record a new price and notify observers.
+
+        Ticks that move the price by `min_delta` or less (by default: not at
+        all) are ignored, and the last notified price is kept.
+        """
+        stock = self._record(symbol, new_price, min_delta)
+        if stock is None:
+            return
 
+        # Watch-everything observers first, then the ones following this symbol
         for observer in self._observers:
             observer.on_price_change(stock)
+        for observer in self._observers_by_symbol.get(symbol, ()):
+            observer.on_price_change(stock)
+
+    def update_prices(self, symbols: Sequence[str], prices: Sequence[float],
+                      min_delta: float = 0.0) -> None:
+        """
+        Apply a batch of ticks, then notify each observer once with
+        every change it cares about (via `on_batch`).
+        """
+        stocks = [
+            stock
+            for symbol, price in zip(symbols, prices, strict=True)
+            if (stock := self._record(symbol, price, min_delta)) is not None
+        ]
+        if not stocks:
+            return
+
+        for observer in self._observers:
+            observer.on_batch(stocks)
+
+        # Keyed by id(): weak proxies aren't hashable
+        routed: dict[int, tuple[StockObserver, list[StockPrice]]] = {}
+        for stock in stocks:
+            for observer in self._observers_by_symbol.get(stock.symbol, ()):
+                routed.setdefault(id(observer), (observer, []))[1].append(stock)
+        for observer, batch in routed.values():
+            observer.on_batch(batch)
 
 
 # ---------------------------------------------------------------------------
@@ -255,6 +542,11 @@ def demo() -> None:
     market.update_price("AAPL", 205.75)
     market.update_price("GOOGL", 148.20)
 
+    # A batch of ticks: each observer hears about all of them in one call
+    print("\n  📦 Batch update:")
+    market.update_prices(["AAPL", "GOOGL"], [198.40, 151.10])
+    print(f"\n  💼 Total portfolio value: ${portfolio.total_value():,.2f}")
+
 
 if __name__ == "__main__":
     demo()
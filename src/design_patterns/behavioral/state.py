@@ -30,8 +30,14 @@ class OrderState(ABC):
         Think of a traffic light. When it's RED, cars must stop.
         When it's GREEN, cars can go. The same object (traffic light)
         behaves differently depending on its current state.
+
+    States hold no data of their own, so each one is a single shared
+    instance (`_PENDING`, `_PROCESSING`, ...) rather than a new object
+    per transition.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def process(self, order: OnlineOrder) -> str:
         ...
@@ -56,12 +62,14 @@ class OrderState(ABC):
 class PendingState(OrderState):
     """Order is created but not yet processed."""
 
+    __slots__ = ()
+
     def process(self, order: OnlineOrder) -> str:
-        order.set_state(ProcessingState())
+        order.set_state(_PROCESSING)
         return "✅ Order is now being processed!"
 
     def cancel(self, order: OnlineOrder) -> str:
-        order.set_state(CancelledState())
+        order.set_state(_CANCELLED)
         return "❌ Order cancelled."
 
     def ship(self, order: OnlineOrder) -> str:
@@ -74,18 +82,23 @@ class PendingState(OrderState):
         return "📋 PENDING"
 
 
+_PENDING = PendingState()
+
+
 class ProcessingState(OrderState):
     """Order is being prepared."""
 
+    __slots__ = ()
+
     def process(self, order: OnlineOrder) -> str:
         return "⚠️ Order is already being processed!"
 
     def cancel(self, order: OnlineOrder) -> str:
-        order.set_state(CancelledState())
+        order.set_state(_CANCELLED)
         return "❌ Order cancelled during processing."
 
     def ship(self, order: OnlineOrder) -> str:
-        order.set_state(ShippedState())
+        order.set_state(_SHIPPED)
         return "📦 Order shipped!"
 
     def deliver(self, order: OnlineOrder) -> str:
@@ -95,9 +108,14 @@ class ProcessingState(OrderState):
         return "⚙️ PROCESSING"
 
 
+_PROCESSING = ProcessingState()
+
+
 class ShippedState(OrderState):
     """Order has been shipped and is in transit."""
 
+    __slots__ = ()
+
     def process(self, order: OnlineOrder) -> str:
         return "⚠️ Order is already shipped!"
 
@@ -108,16 +126,21 @@ class ShippedState(OrderState):
         return "⚠️ Order is already shipped!"
 
     def deliver(self, order: OnlineOrder) -> str:
-        order.set_state(DeliveredState())
+        order.set_state(_DELIVERED)
         return "🎉 Order delivered successfully!"
 
     def get_status(self) -> str:
         return "🚚 SHIPPED"
 
 
+_SHIPPED = ShippedState()
+
+
 class DeliveredState(OrderState):
     """Order has been delivered."""
 
+    __slots__ = ()
+
     def process(self, order: OnlineOrder) -> str:
         return "⚠️ Order already delivered — nothing to process!"
 
@@ -134,9 +157,14 @@ class DeliveredState(OrderState):
         return "✅ DELIVERED"
 
 
+_DELIVERED = DeliveredState()
+
+
 class CancelledState(OrderState):
     """Order has been cancelled."""
 
+    __slots__ = ()
+
     def process(self, order: OnlineOrder) -> str:
         return "⚠️ Can't process — order was cancelled."
 
@@ -153,6 +181,9 @@ class CancelledState(OrderState):
         return "❌ CANCELLED"
 
 
+_CANCELLED = CancelledState()
+
+
 class OnlineOrder:
     """
     Context: The order whose behavior changes based on its state.
@@ -160,7 +191,7 @@ class OnlineOrder:
 
     def __init__(self, order_id: str) -> None:
         self.order_id = order_id
-        self._state: OrderState = PendingState()
+        self._state: OrderState = _PENDING
 
     def set_state(self, state: OrderState) -> None:
         self._state = state
@@ -187,6 +218,8 @@ class OnlineOrder:
 
 
 class PlayerState(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def play(self, player: AudioPlayer) -> str:
         ...
@@ -205,8 +238,10 @@ class PlayerState(ABC):
 
 
 class StoppedPlayerState(PlayerState):
+    __slots__ = ()
+
     def play(self, player: AudioPlayer) -> str:
-        player.set_state(PlayingState())
+        player.set_state(_PLAYING)
         return "▶️  Playing music!"
 
     def pause(self, player: AudioPlayer) -> str:
@@ -219,42 +254,55 @@ class StoppedPlayerState(PlayerState):
         return "⏹️  Stopped"
 
 
+_STOPPED = StoppedPlayerState()
+
+
 class PlayingState(PlayerState):
+    __slots__ = ()
+
     def play(self, player: AudioPlayer) -> str:
         return "⚠️ Already playing!"
 
     def pause(self, player: AudioPlayer) -> str:
-        player.set_state(PausedState())
+        player.set_state(_PAUSED)
         return "⏸️  Paused."
 
     def stop(self, player: AudioPlayer) -> str:
-        player.set_state(StoppedPlayerState())
+        player.set_state(_STOPPED)
         return "⏹️  Stopped."
 
     def get_status(self) -> str:
         return "▶️  Playing"
 
 
+_PLAYING = PlayingState()
+
+
 class PausedState(PlayerState):
+    __slots__ = ()
+
     def play(self, player: AudioPlayer) -> str:
-        player.set_state(PlayingState())
+        player.set_state(_PLAYING)
         return "▶️  Resumed playing!"
 
     def pause(self, player: AudioPlayer) -> str:
         return "⚠️ Already paused!"
 
     def stop(self, player: AudioPlayer) -> str:
-        player.set_state(StoppedPlayerState())
+        player.set_state(_STOPPED)
         return "⏹️  Stopped."
 
     def get_status(self) -> str:
         return "⏸️  Paused"
 
 
+_PAUSED = PausedState()
+
+
 class AudioPlayer:
     def __init__(self, song: str) -> None:
         self.song = song
-        self._state: PlayerState = StoppedPlayerState()
+        self._state: PlayerState = _STOPPED
 
     def set_state(self, state: PlayerState) -> None:
         self._state = state
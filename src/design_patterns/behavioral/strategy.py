@@ -12,8 +12,10 @@ can be swapped easily.
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from operator import attrgetter
 
 
 # ---------------------------------------------------------------------------
@@ -31,6 +33,8 @@ class DiscountStrategy(ABC):
         but they all answer the same question: "How much do I save?"
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def calculate_discount(self, original_price: float) -> float:
         """Return the discount amount (not the final price)."""
@@ -44,6 +48,8 @@ class DiscountStrategy(ABC):
 class NoDiscount(DiscountStrategy):
     """No discount — pay full price."""
 
+    __slots__ = ()
+
     def calculate_discount(self, original_price: float) -> float:
         return 0.0
 
@@ -54,11 +60,14 @@ class NoDiscount(DiscountStrategy):
 class PercentageDiscount(DiscountStrategy):
     """Percentage-based discount (e.g., 20% off)."""
 
+    __slots__ = ("_percentage", "_fraction")
+
     def __init__(self, percentage: float) -> None:
         self._percentage = min(percentage, 100)  # Cap at 100%
+        self._fraction = self._percentage / 100
 
     def calculate_discount(self, original_price: float) -> float:
-        return original_price * (self._percentage / 100)
+        return original_price * self._fraction
 
     def get_name(self) -> str:
         return f"{self._percentage}% Off"
@@ -67,6 +76,8 @@ class PercentageDiscount(DiscountStrategy):
 class FlatDiscount(DiscountStrategy):
     """Fixed amount discount (e.g., $10 off)."""
 
+    __slots__ = ("_amount",)
+
     def __init__(self, amount: float) -> None:
         self._amount = amount
 
@@ -80,6 +91,8 @@ class FlatDiscount(DiscountStrategy):
 class BuyOneGetOneFree(DiscountStrategy):
     """Buy one get one free — 50% off."""
 
+    __slots__ = ()
+
     def calculate_discount(self, original_price: float) -> float:
         return original_price * 0.5
 
@@ -90,24 +103,28 @@ class BuyOneGetOneFree(DiscountStrategy):
 class SeasonalDiscount(DiscountStrategy):
     """Seasonal sale discount with tiered pricing."""
 
+    _RATES = {
+        "summer": 15,
+        "winter": 25,
+        "black_friday": 40,
+        "clearance": 60,
+    }
+
+    __slots__ = ("_season", "_fraction")
+
     def __init__(self, season: str) -> None:
         self._season = season
-        self._rates = {
-            "summer": 15,
-            "winter": 25,
-            "black_friday": 40,
-            "clearance": 60,
-        }
+        # The season never changes, so look its rate up once
+        self._fraction = self._RATES.get(season.lower(), 0) / 100
 
     def calculate_discount(self, original_price: float) -> float:
-        rate = self._rates.get(self._season.lower(), 0)
-        return original_price * (rate / 100)
+        return original_price * self._fraction
 
     def get_name(self) -> str:
         return f"{self._season.title()} Sale"
 
 
-@dataclass
+@dataclass(slots=True)
 class CartItem:
     name: str
     price: float
@@ -118,38 +135,53 @@ class ShoppingCart:
     """
     Shopping cart that uses a discount strategy.
     The strategy can be changed at any time!
+
+    The subtotal is kept as a running total and the discount is remembered
+    until an item is added or the strategy changes (items are treated as
+    read-only once in the cart).
     """
 
     def __init__(self, discount_strategy: DiscountStrategy | None = None) -> None:
         self._items: list[CartItem] = []
         self._strategy = discount_strategy or NoDiscount()
+        self._subtotal = 0.0
+        self._discount_cache: float | None = None
 
     def add_item(self, item: CartItem) -> None:
         self._items.append(item)
+        self._subtotal += item.price * item.quantity
+        self._discount_cache = None
 
     def set_discount_strategy(self, strategy: DiscountStrategy) -> None:
         """Change the discount strategy at runtime."""
         self._strategy = strategy
+        self._discount_cache = None
 
     def get_subtotal(self) -> float:
-        return sum(item.price * item.quantity for item in self._items)
+        return self._subtotal
 
     def get_discount(self) -> float:
-        return self._strategy.calculate_discount(self.get_subtotal())
+        if self._discount_cache is None:
+            self._discount_cache = self._strategy.calculate_discount(self._subtotal)
+        return self._discount_cache
 
     def get_total(self) -> float:
         return self.get_subtotal() - self.get_discount()
 
     def print_receipt(self) -> None:
-        print(f"  {'Item':<25} {'Qty':>4} {'Price':>10}")
-        print(f"  {'-'*25} {'-'*4} {'-'*10}")
+        # Build the whole receipt, then write it to stdout in one go
+        lines = [
+            f"  {'Item':<25} {'Qty':>4} {'Price':>10}",
+            f"  {'-'*25} {'-'*4} {'-'*10}",
+        ]
         for item in self._items:
             total = item.price * item.quantity
-            print(f"  {item.name:<25} {item.quantity:>4} ${total:>8.2f}")
-        print(f"  {'':>25} {'':>4} {'-'*10}")
-        print(f"  {'Subtotal:':<30} ${self.get_subtotal():>8.2f}")
-        print(f"  {'Discount (' + self._strategy.get_name() + '):':<30} -${self.get_discount():>7.2f}")
-        print(f"  {'TOTAL:':<30} ${self.get_total():>8.2f}")
+            lines.append(f"  {item.name:<25} {item.quantity:>4} ${total:>8.2f}")
+        lines.append(f"  {'':>25} {'':>4} {'-'*10}")
+        lines.append(f"  {'Subtotal:':<30} ${self.get_subtotal():>8.2f}")
+        lines.append(f"  {'Discount (' + self._strategy.get_name() + '):':<30} -${self.get_discount():>7.2f}")
+        lines.append(f"  {'TOTAL:':<30} ${self.get_total():>8.2f}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -160,6 +192,8 @@ class ShoppingCart:
 class SortStrategy(ABC):
     """Strategy for sorting data."""
 
+    __slots__ = ()
+
     @abstractmethod
     def sort(self, data: list) -> list:
         ...
@@ -170,6 +204,8 @@ class SortStrategy(ABC):
 
 
 class AlphabeticalSort(SortStrategy):
+    __slots__ = ()
+
     def sort(self, data: list) -> list:
         return sorted(data, key=str)
 
@@ -177,17 +213,24 @@ class AlphabeticalSort(SortStrategy):
         return "Alphabetical"
 
 
+_PRICE_KEY = attrgetter("price")  # C-level key function, cheaper than a lambda
+
+
 class PriceLowToHigh(SortStrategy):
+    __slots__ = ()
+
     def sort(self, data: list[CartItem]) -> list[CartItem]:
-        return sorted(data, key=lambda x: x.price)
+        return sorted(data, key=_PRICE_KEY)
 
     def get_name(self) -> str:
         return "Price: Low → High"
 
 
 class PriceHighToLow(SortStrategy):
+    __slots__ = ()
+
     def sort(self, data: list[CartItem]) -> list[CartItem]:
-        return sorted(data, key=lambda x: x.price, reverse=True)
+        return sorted(data, key=_PRICE_KEY, reverse=True)
 
     def get_name(self) -> str:
         return "Price: High → Low"
@@ -12,7 +12,16 @@ The TEMPLATE is the same, but the details (brew tea vs. brew coffee) differ.
 
 from __future__ import annotations
 
+import logging
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+
+# Pipeline steps report progress at DEBUG level, so the messages cost nothing
+# unless someone is listening (the demo runner turns them on).
+log = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -39,16 +48,16 @@ class DataProcessor(ABC):
         Template method — defines the algorithm skeleton.
         Subclasses override individual steps, NOT this method.
         """
-        print(f"    📁 Step 1: Reading data from {source}")
+        log.debug("    📁 Step 1: Reading data from %s", source)
         raw_data = self.read_data(source)
 
-        print(f"    🔍 Step 2: Validating data ({len(raw_data)} records)")
+        log.debug("    🔍 Step 2: Validating data (%d records)", len(raw_data))
         valid_data = self.validate_data(raw_data)
 
-        print(f"    🔄 Step 3: Transforming data ({len(valid_data)} valid records)")
+        log.debug("    🔄 Step 3: Transforming data (%d valid records)", len(valid_data))
         transformed = self.transform_data(valid_data)
 
-        print(f"    💾 Step 4: Saving results")
+        log.debug("    💾 Step 4: Saving results")
         result = self.save_data(transformed)
 
         # Hook: optional step that subclasses CAN override
@@ -56,6 +65,15 @@ class DataProcessor(ABC):
 
         return result
 
+    def process_batch(self, sources: Iterable[str], max_workers: int | None = None) -> list[dict]:
+        """
+        Run the template on several sources concurrently (results keep the
+        input order). Worth it when reading/saving waits on files or the
+        network; the steps must not share mutable state between sources.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.process, sources))
+
     @abstractmethod
     def read_data(self, source: str) -> list[dict]:
         """Read raw data from the source."""
@@ -94,11 +112,10 @@ class CSVDataProcessor(DataProcessor):
         ]
 
     def validate_data(self, data: list[dict]) -> list[dict]:
-        valid = []
-        for record in data:
-            if record.get("name") and record.get("age", "").isdigit():
-                valid.append(record)
-        return valid
+        return [
+            record for record in data
+            if record.get("name") and record.get("age", "").isdigit()
+        ]
 
     def transform_data(self, data: list[dict]) -> list[dict]:
         return [
@@ -145,7 +162,7 @@ class JSONDataProcessor(DataProcessor):
         return {"format": "JSON", "records_saved": len(data), "data": data}
 
     def on_complete(self, result: dict) -> None:
-        print(f"    📊 JSON processing complete: {result['records_saved']} records saved")
+        log.debug("    📊 JSON processing complete: %d records saved", result["records_saved"])
 
 
 # ---------------------------------------------------------------------------
@@ -161,13 +178,10 @@ class BeverageMaker(ABC):
 
     def make(self) -> str:
         """Template method — the recipe steps."""
-        steps = []
-        steps.append(self.boil_water())
-        steps.append(self.brew())
-        steps.append(self.pour_in_cup())
+        boil, brew, pour = self.boil_water(), self.brew(), self.pour_in_cup()
         if self.wants_condiments():  # Hook!
-            steps.append(self.add_condiments())
-        return " → ".join(steps)
+            return f"{boil} → {brew} → {pour} → {self.add_condiments()}"
+        return f"{boil} → {brew} → {pour}"
 
     def boil_water(self) -> str:
         return "Boil water"
@@ -266,4 +280,5 @@ def demo() -> None:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
     demo()
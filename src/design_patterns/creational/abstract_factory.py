@@ -21,6 +21,8 @@ from abc import ABC, abstractmethod
 class Button(ABC):
     """Abstract button that all platforms must implement."""
 
+    __slots__ = ()
+
     @abstractmethod
     def render(self) -> str:
         ...
@@ -33,6 +35,8 @@ class Button(ABC):
 class TextInput(ABC):
     """Abstract text input that all platforms must implement."""
 
+    __slots__ = ()
+
     @abstractmethod
     def render(self) -> str:
         ...
@@ -45,6 +49,8 @@ class TextInput(ABC):
 class Checkbox(ABC):
     """Abstract checkbox that all platforms must implement."""
 
+    __slots__ = ()
+
     @abstractmethod
     def render(self) -> str:
         ...
@@ -60,6 +66,8 @@ class Checkbox(ABC):
 
 
 class WebButton(Button):
+    __slots__ = ()
+
     def render(self) -> str:
         return "🌐 <button class='btn btn-primary'>Click Me</button>"
 
@@ -68,6 +76,8 @@ class WebButton(Button):
 
 
 class WebTextInput(TextInput):
+    __slots__ = ()
+
     def render(self) -> str:
         return "🌐 <input type='text' class='form-control' />"
 
@@ -76,6 +86,8 @@ class WebTextInput(TextInput):
 
 
 class WebCheckbox(Checkbox):
+    __slots__ = ()
+
     def render(self) -> str:
         return "🌐 <input type='checkbox' class='form-check' />"
 
@@ -89,6 +101,8 @@ class WebCheckbox(Checkbox):
 
 
 class MobileButton(Button):
+    __slots__ = ()
+
     def render(self) -> str:
         return "📱 UIButton(title: 'Click Me', style: .filled)"
 
@@ -97,6 +111,8 @@ class MobileButton(Button):
 
 
 class MobileTextInput(TextInput):
+    __slots__ = ()
+
     def render(self) -> str:
         return "📱 UITextField(borderStyle: .roundedRect)"
 
@@ -105,6 +121,8 @@ class MobileTextInput(TextInput):
 
 
 class MobileCheckbox(Checkbox):
+    __slots__ = ()
+
     def render(self) -> str:
         return "📱 UISwitch(isOn: false)"
 
@@ -118,6 +136,8 @@ class MobileCheckbox(Checkbox):
 
 
 class DesktopButton(Button):
+    __slots__ = ()
+
     def render(self) -> str:
         return "🖥️  QPushButton('Click Me')"
 
@@ -126,6 +146,8 @@ class DesktopButton(Button):
 
 
 class DesktopTextInput(TextInput):
+    __slots__ = ()
+
     def render(self) -> str:
         return "🖥️  QLineEdit()"
 
@@ -134,6 +156,8 @@ class DesktopTextInput(TextInput):
 
 
 class DesktopCheckbox(Checkbox):
+    __slots__ = ()
+
     def render(self) -> str:
         return "🖥️  QCheckBox('Option')"
 
@@ -155,6 +179,9 @@ class UIFactory(ABC):
         If you go to the "Modern" section, EVERYTHING is modern —
         modern chair, modern table, modern lamp. They all match!
         That's what an Abstract Factory does for your code.
+
+    The components carry no state, so the concrete factories hand out one
+    shared instance of each instead of building a new one per call.
     """
 
     @abstractmethod
@@ -178,40 +205,52 @@ class UIFactory(ABC):
 class WebUIFactory(UIFactory):
     """Factory for web UI components."""
 
+    _BUTTON = WebButton()
+    _TEXT_INPUT = WebTextInput()
+    _CHECKBOX = WebCheckbox()
+
     def create_button(self) -> Button:
-        return WebButton()
+        return self._BUTTON
 
     def create_text_input(self) -> TextInput:
-        return WebTextInput()
+        return self._TEXT_INPUT
 
     def create_checkbox(self) -> Checkbox:
-        return WebCheckbox()
+        return self._CHECKBOX
 
 
 class MobileUIFactory(UIFactory):
     """Factory for mobile UI components."""
 
+    _BUTTON = MobileButton()
+    _TEXT_INPUT = MobileTextInput()
+    _CHECKBOX = MobileCheckbox()
+
     def create_button(self) -> Button:
-        return MobileButton()
+        return self._BUTTON
 
     def create_text_input(self) -> TextInput:
-        return MobileTextInput()
+        return self._TEXT_INPUT
 
     def create_checkbox(self) -> Checkbox:
-        return MobileCheckbox()
+        return self._CHECKBOX
 
 
 class DesktopUIFactory(UIFactory):
     """Factory for desktop UI components."""
 
+    _BUTTON = DesktopButton()
+    _TEXT_INPUT = DesktopTextInput()
+    _CHECKBOX = DesktopCheckbox()
+
     def create_button(self) -> Button:
-        return DesktopButton()
+        return self._BUTTON
 
     def create_text_input(self) -> TextInput:
-        return DesktopTextInput()
+        return self._TEXT_INPUT
 
     def create_checkbox(self) -> Checkbox:
-        return DesktopCheckbox()
+        return self._CHECKBOX
 
 
 # ---------------------------------------------------------------------------
@@ -10,7 +10,7 @@ You pick your main dish, then your drink, then your dessert — step by step.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Self
 
 
@@ -19,7 +19,7 @@ from typing import Self
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpRequest:
     """Represents an HTTP request with all its parts."""
     method: str = "GET"
@@ -32,17 +32,16 @@ class HttpRequest:
     auth_token: str | None = None
 
     def __str__(self) -> str:
-        parts = [
-            f"  Method: {self.method}",
-            f"  URL: {self.url}",
-            f"  Headers: {self.headers}",
-            f"  Query Params: {self.query_params}",
-            f"  Body: {self.body}",
-            f"  Timeout: {self.timeout}s",
-            f"  Retries: {self.retries}",
-            f"  Auth: {'✅ Set' if self.auth_token else '❌ None'}",
-        ]
-        return "\n".join(parts)
+        return (
+            f"  Method: {self.method}\n"
+            f"  URL: {self.url}\n"
+            f"  Headers: {self.headers}\n"
+            f"  Query Params: {self.query_params}\n"
+            f"  Body: {self.body}\n"
+            f"  Timeout: {self.timeout}s\n"
+            f"  Retries: {self.retries}\n"
+            f"  Auth: {'✅ Set' if self.auth_token else '❌ None'}"
+        )
 
 
 class HttpRequestBuilder:
@@ -116,13 +115,40 @@ class HttpRequestBuilder:
             raise ValueError("URL is required to build an HTTP request")
         return self._request
 
+    @classmethod
+    def from_kwargs(
+        cls,
+        url: str,
+        *,
+        method: str = "GET",
+        headers: dict[str, str] | None = None,
+        query_params: dict[str, str] | None = None,
+        body: str | dict | None = None,
+        timeout: int = 30,
+        retries: int = 0,
+        auth_token: str | None = None,
+    ) -> HttpRequest:
+        """
+        Build a request in a single call — same rules as the fluent API,
+        without creating a builder or chaining calls. Handy in hot loops.
+        """
+        if not url:
+            raise ValueError("URL is required to build an HTTP request")
+        headers = dict(headers) if headers else {}
+        if auth_token is not None:
+            headers["Authorization"] = f"Bearer {auth_token}"
+        return HttpRequest(
+            method.upper(), url, headers, dict(query_params) if query_params else {},
+            body, timeout, retries, auth_token,
+        )
+
 
 # ---------------------------------------------------------------------------
 # Real-World Example 2: User Profile Builder
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """A user profile with many optional fields."""
     username: str = ""
@@ -137,7 +163,8 @@ class UserProfile:
     preferences: dict[str, str] = field(default_factory=dict)
 
     def __str__(self) -> str:
-        parts = [f"  {k}: {v}" for k, v in self.__dict__.items() if v]
+        values = ((f.name, getattr(self, f.name)) for f in fields(self))
+        parts = [f"  {k}: {v}" for k, v in values if v]
         return "\n".join(parts)
 
 
@@ -194,7 +221,7 @@ class UserProfileBuilder:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Pizza:
     """A pizza with customizable options."""
     size: str = "medium"
@@ -223,6 +250,10 @@ class PizzaBuilder:
     Real-life analogy:
         Ordering a custom pizza at Domino's — you pick size,
         crust, sauce, cheese, and toppings step by step.
+
+    If every choice is known up front, `Pizza(size="large", toppings=[...])`
+    builds it in one call; the builder pays off when choices arrive one at a
+    time (e.g. from a UI).
     """
 
     def __init__(self) -> None:
@@ -131,6 +131,9 @@ class PaymentFactory:
         Think of a restaurant kitchen. You tell the waiter "I want a burger."
         The kitchen (factory) knows exactly which chef and recipe to use.
         You never go into the kitchen — you just get your burger!
+
+    Processors are stateless, so each method's processor is created once
+    and then shared by every `create()` call.
     """
 
     _processors: dict[PaymentMethod, type[PaymentProcessor]] = {
@@ -139,19 +142,24 @@ class PaymentFactory:
         PaymentMethod.PAYPAL: PayPalProcessor,
         PaymentMethod.BANK_TRANSFER: BankTransferProcessor,
     }
+    _instances: dict[PaymentMethod, PaymentProcessor] = {}
 
     @classmethod
     def create(cls, method: PaymentMethod) -> PaymentProcessor:
-        """Create a payment processor for the given method."""
-        processor_class = cls._processors.get(method)
-        if processor_class is None:
-            raise ValueError(f"Unsupported payment method: {method}")
-        return processor_class()
+        """Get the (shared) payment processor for the given method."""
+        processor = cls._instances.get(method)
+        if processor is None:
+            processor_class = cls._processors.get(method)
+            if processor_class is None:
+                raise ValueError(f"Unsupported payment method: {method}")
+            cls._instances[method] = processor = processor_class()
+        return processor
 
     @classmethod
     def register(cls, method: PaymentMethod, processor: type[PaymentProcessor]) -> None:
         """Register a new payment processor (extensibility!)."""
         cls._processors[method] = processor
+        cls._instances.pop(method, None)  # Next create() builds the new one
 
 
 # ---------------------------------------------------------------------------
@@ -196,6 +204,8 @@ class NotificationFactory:
         Think of a post office. You say "I want to send a letter"
         or "I want to send a parcel." The post office handles it differently
         based on what you need — but YOU just drop it off.
+
+    Like `PaymentFactory`, each channel's sender is created once and shared.
     """
 
     _notifiers: dict[str, type[Notification]] = {
@@ -204,14 +214,19 @@ class NotificationFactory:
         "push": PushNotification,
         "slack": SlackNotification,
     }
+    _instances: dict[str, Notification] = {}
 
     @classmethod
     def create(cls, channel: str) -> Notification:
-        """Create a notification sender for the given channel."""
-        notifier_class = cls._notifiers.get(channel.lower())
-        if notifier_class is None:
-            raise ValueError(f"Unknown notification channel: {channel}")
-        return notifier_class()
+        """Get the (shared) notification sender for the given channel."""
+        key = channel.lower()
+        notifier = cls._instances.get(key)
+        if notifier is None:
+            notifier_class = cls._notifiers.get(key)
+            if notifier_class is None:
+                raise ValueError(f"Unknown notification channel: {channel}")
+            cls._instances[key] = notifier = notifier_class()
+        return notifier
 
 
 # ---------------------------------------------------------------------------
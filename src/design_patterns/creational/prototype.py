@@ -10,8 +10,7 @@ and you make copies, then customize each copy slightly.
 
 from __future__ import annotations
 
-import copy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 
@@ -38,8 +37,21 @@ class Document:
     metadata: dict[str, str] = field(default_factory=dict)
 
     def clone(self) -> Document:
-        """Create a deep copy of this document."""
-        return copy.deepcopy(self)
+        """
+        Create an independent copy of this document.
+
+        `replace` keeps the subclass and any fields added later; strings are
+        immutable and shared, while the containers are copied, so editing the
+        clone's tags/formatting/metadata never touches the template.
+        (Formatting values are expected to be plain values like str/int —
+        nested containers inside them would be shared.)
+        """
+        return replace(
+            self,
+            formatting=dict(self.formatting),
+            tags=list(self.tags),
+            metadata=dict(self.metadata),
+        )
 
     def __str__(self) -> str:
         return (
@@ -103,8 +115,9 @@ class GameCharacter:
     position: tuple[int, int] = (0, 0)
 
     def clone(self) -> GameCharacter:
-        """Create a deep copy of this character."""
-        return copy.deepcopy(self)
+        """Create an independent copy of this character (see `Document.clone`)."""
+        # `position` is a tuple — immutable, safe to share
+        return replace(self, abilities=list(self.abilities), equipment=dict(self.equipment))
 
     def __str__(self) -> str:
         return (
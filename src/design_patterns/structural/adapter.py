@@ -11,6 +11,8 @@ so you use an adapter in between. The adapter makes them work together!
 
 from __future__ import annotations
 
+import csv
+import io
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
@@ -196,13 +198,12 @@ class CSVToJSONAdapter(ModernJSONAPI):
         self._csv_exporter = csv_exporter
 
     def get_data(self) -> list[dict[str, str]]:
-        csv_string = self._csv_exporter.export_data()
-        lines = csv_string.strip().split("\n")
-        headers = lines[0].split(",")
-        return [
-            dict(zip(headers, line.split(",")))
-            for line in lines[1:]
-        ]
+        # csv.reader tokenizes in C in a single pass (and handles quoted fields)
+        reader = csv.reader(io.StringIO(self._csv_exporter.export_data()))
+        headers = next(reader, None)
+        if headers is None:
+            return []
+        return [dict(zip(headers, row)) for row in reader if row]
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,89 @@
+"""Tests for the asynchronous QueuedOrder observer delivery."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# Load the module by path: the behavioral package __init__ pulls in every
+# pattern module, and these tests only need the observer one.
+_PATH = Path(__file__).resolve().parents[1] / "src/design_patterns/behavioral/observer.py"
+_spec = importlib.util.spec_from_file_location("observer_under_test", _PATH)
+observer = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = observer  # Dataclasses look their module up here
+_spec.loader.exec_module(observer)
+
+OrderStatus = observer.OrderStatus
+
+
+class Recorder(observer.OrderObserver):
+    def __init__(self):
+        self.events = []
+
+    def update(self, order_id, status, details):
+        self.events.append((order_id, status, details))
+
+
+class Exploding(observer.OrderObserver):
+    def __init__(self):
+        self.seen = []
+
+    def update(self, order_id, status, details):
+        self.seen.append(status)
+        if status == OrderStatus.CONFIRMED:
+            raise RuntimeError("boom")
+
+
+def test_events_delivered_in_order_after_flush():
+    order = observer.QueuedOrder("ORD-1")
+    recorder = Recorder()
+    order.subscribe(recorder)
+
+    order.update_status(OrderStatus.CONFIRMED, "paid")
+    order.update_status(OrderStatus.SHIPPED, "on the way")
+    order.flush()
+
+    assert recorder.events == [
+        ("ORD-1", OrderStatus.CONFIRMED, "paid"),
+        ("ORD-1", OrderStatus.SHIPPED, "on the way"),
+    ]
+    order.close()
+
+
+def test_raising_observer_keeps_receiving_events(caplog):
+    order = observer.QueuedOrder("ORD-2")
+    exploding, recorder = Exploding(), Recorder()
+    order.subscribe(exploding)
+    order.subscribe(recorder)
+
+    order.update_status(OrderStatus.CONFIRMED)
+    order.update_status(OrderStatus.SHIPPED)
+    order.flush()  # Must not hang on the failed event
+
+    assert exploding.seen == [OrderStatus.CONFIRMED, OrderStatus.SHIPPED]
+    assert len(recorder.events) == 2
+    assert "boom" in caplog.text
+    order.close()
+
+
+def test_close_drains_queue_and_rejects_updates():
+    order = observer.QueuedOrder("ORD-3")
+    recorder = Recorder()
+    order.subscribe(recorder)
+
+    order.update_status(OrderStatus.CONFIRMED)
+    order.close()
+
+    assert recorder.events == [("ORD-3", OrderStatus.CONFIRMED, "")]
+    with pytest.raises(RuntimeError, match="closed"):
+        order.update_status(OrderStatus.SHIPPED)
+    with pytest.raises(RuntimeError, match="closed"):
+        order.subscribe(Recorder())
+
+
+def test_weak_subscription_rejected():
+    order = observer.QueuedOrder("ORD-4")
+    with pytest.raises(ValueError, match="weak"):
+        order.subscribe(Recorder(), weak=True)
+    order.close()
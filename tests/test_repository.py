@@ -0,0 +1,59 @@
+"""Tests for the in-memory user repository's uniqueness checks."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# Loaded by path, like the observer tests, so only this module is imported.
+_PATH = Path(__file__).resolve().parents[1] / "src/design_patterns/architectural/repository.py"
+_spec = importlib.util.spec_from_file_location("repository_under_test", _PATH)
+repository = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = repository  # Dataclasses look their module up here
+_spec.loader.exec_module(repository)
+
+User = repository.User
+
+
+def make_repo():
+    repo = repository.InMemoryUserRepository()
+    repo.add(User(username="a", email="a@example.com"))
+    repo.add(User(username="b", email="b@example.com"))
+    return repo
+
+
+def test_in_place_edit_that_clashes_is_rolled_back():
+    repo = make_repo()
+    user = repo.find_by_id(1)
+    user.username = "b"
+
+    with pytest.raises(ValueError, match="username 'b'"):
+        repo.update(user)
+
+    assert user.username == "a"
+    assert repo.find_by_username("a") is user
+    assert repo.find_by_username("b").id == 2
+
+
+def test_clashing_copy_leaves_stored_user_alone():
+    repo = make_repo()
+    copy = User(id=1, username="a", email="b@example.com")
+
+    with pytest.raises(ValueError, match="email 'b@example.com'"):
+        repo.update(copy)
+
+    assert copy.email == "b@example.com"  # Not ours to undo
+    assert repo.find_by_email("a@example.com").id == 1
+
+
+def test_add_many_is_all_or_nothing():
+    repo = make_repo()
+    batch = [User(username="c", email="c@example.com"),
+             User(username="d", email="c@example.com")]
+
+    with pytest.raises(ValueError, match="twice in the batch"):
+        repo.add_many(batch)
+
+    assert len(repo.find_all()) == 2
+    assert repo.find_by_username("c") is None